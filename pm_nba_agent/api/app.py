@@ -19,6 +19,7 @@ from .services.auth import load_users
 from .services.data_fetcher import DataFetcher
 from ..agent import GameAnalyzer, AnalysisConfig
 from ..logging_config import configure_logging
+from ..polymarket._http import close_http_clients
 from ..shared import RedisClient
 
 configure_logging()
@@ -63,6 +64,7 @@ async def lifespan(app: FastAPI):
     if app.state.redis:
         await app.state.redis.close()
     await app.state.analyzer.close()
+    await close_http_clients()
     app.state.fetcher.shutdown()
     logger.info("资源已关闭")
 
@@ -3,7 +3,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
-import json
+
+from ...shared import JSON_ENCODER
 
 
 @dataclass
@@ -14,7 +15,7 @@ class SSEEvent:
 
     def to_sse(self) -> str:
         """转换为 SSE 格式字符串"""
-        json_data = json.dumps(self.data, ensure_ascii=False)
+        json_data = JSON_ENCODER.encode(self.data)
         return f"event: {self.event_type}\ndata: {json_data}\n\n"
 
 
@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-from datetime import datetime
 from typing import Any, AsyncGenerator, Optional
 
 from fastapi import APIRouter, Request, HTTPException
@@ -11,7 +10,7 @@ from loguru import logger
 from redis.exceptions import ConnectionError as RedisConnectionError
 
 from ..services.auth import require_auth
-from ...shared import Channels, RedisClient, TaskState, TaskStatus
+from ...shared import JSON_ENCODER, Channels, RedisClient, TaskState, TaskStatus, utc_now_iso
 
 
 router = APIRouter(prefix="/api/v1/live", tags=["live"])
@@ -25,6 +24,9 @@ ACTIVE_TASK_STATES = {
 USER_STREAM_SYNC_INTERVAL_SECONDS = 2.0
 USER_STREAM_HEARTBEAT_SECONDS = 15.0
 
+# 可回放的状态快照事件：每条都完整覆盖同类型的上一条
+_SNAPSHOT_EVENT_TYPE_SET = frozenset(Channels.SNAPSHOT_EVENTS)
+
 
 def require_redis(request: Request) -> RedisClient:
     """获取 Redis 客户端"""
@@ -44,6 +46,35 @@ def normalize_sse_message(message: str) -> str:
     return message
 
 
+def sse_event_type(event: str) -> Optional[str]:
+    """读取 SSE 消息首行的事件类型（不解析 data）"""
+    if not event.startswith("event:"):
+        return None
+    end = event.find("\n")
+    return event[6:end if end >= 0 else None].strip()
+
+
+def coalesce_snapshot_events(events: list[str]) -> list[str]:
+    """同一批次内同类型状态快照只保留最后一条，其余事件保持原顺序"""
+    if len(events) < 2:
+        return events
+
+    event_types = [sse_event_type(event) for event in events]
+    last_index = {
+        event_type: index
+        for index, event_type in enumerate(event_types)
+        if event_type in _SNAPSHOT_EVENT_TYPE_SET
+    }
+    if len(last_index) == sum(t in _SNAPSHOT_EVENT_TYPE_SET for t in event_types):
+        return events
+
+    return [
+        event
+        for index, (event, event_type) in enumerate(zip(events, event_types))
+        if event_type not in last_index or last_index[event_type] == index
+    ]
+
+
 def parse_sse_event(event: str) -> tuple[Optional[str], Optional[dict[str, Any]]]:
     """解析 SSE 事件字符串，返回 (event_type, payload)"""
     event_type: Optional[str] = None
@@ -73,12 +104,12 @@ def parse_sse_event(event: str) -> tuple[Optional[str], Optional[dict[str, Any]]
 
 def format_sse_event(event_type: str, payload: dict[str, Any]) -> str:
     """格式化 SSE 消息"""
-    return f"event: {event_type}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    return f"event: {event_type}\ndata: {JSON_ENCODER.encode(payload)}\n\n"
 
 
 def now_iso() -> str:
     """当前 UTC 时间（ISO）"""
-    return datetime.utcnow().isoformat() + "Z"
+    return utc_now_iso()
 
 
 def to_task_execution_payload(task_id: str, payload: dict[str, Any]) -> dict[str, Any]:
@@ -216,35 +247,33 @@ async def subscribe_task(
             yield f'event: subscribed\ndata: {{"task_id": "{task_id}"}}\n\n'
             yield f"event: task_status\ndata: {status.to_json()}\n\n"
 
-            snapshot_events = [
-                "polymarket_info",
-                "scoreboard",
-                "polymarket_book",
-                "auto_buy_state",
-                "auto_trade_state",
-                "auto_sell_state",
-                "position_state",
-            ]
-            for event_name in snapshot_events:
-                snapshot_key = Channels.task_snapshot(task_id, event_name)
-                snapshot_event = await redis.get(snapshot_key)
+            snapshots = await redis.hgetall(Channels.task_snapshots(task_id))
+            for event_name in Channels.SNAPSHOT_EVENTS:
+                snapshot_event = snapshots.get(event_name)
                 if snapshot_event:
                     yield normalize_sse_message(snapshot_event)
 
-            async for message in pubsub.listen():
+            finished = False
+            while not finished:
+                # 突发推送时一次取出已到达的消息，合并被后续快照覆盖的旧快照
+                batch = await RedisClient.get_message_batch(pubsub)
+
                 # 检查客户端是否断开
                 if await request.is_disconnected():
                     break
 
-                if message["type"] != "message":
-                    continue
-
-                event_data = normalize_sse_message(message["data"])
-                yield event_data
-
-                # 如果是任务结束事件，退出循环
-                if "event: task_end" in event_data or "event: game_end" in event_data:
-                    break
+                events = coalesce_snapshot_events([
+                    normalize_sse_message(message["data"])
+                    for message in batch
+                    if message["type"] == "message"
+                ])
+                for event_data in events:
+                    yield event_data
+
+                    # 如果是任务结束事件，退出循环
+                    if "event: task_end" in event_data or "event: game_end" in event_data:
+                        finished = True
+                        break
 
         except RedisConnectionError as e:
             logger.error("Redis 连接错误 (task={}): {}", task_id, e)
@@ -328,8 +357,9 @@ async def subscribe_user_tasks(request: Request) -> StreamingResponse:
 
                         # 每个活跃任务在连接期间只回放一次持仓快照
                         if task_id not in sent_position_snapshot:
-                            snapshot_key = Channels.task_snapshot(task_id, "position_state")
-                            snapshot_event = await redis.get(snapshot_key)
+                            snapshot_event = await redis.hget(
+                                Channels.task_snapshots(task_id), "position_state"
+                            )
                             if snapshot_event:
                                 event_type, payload = parse_sse_event(normalize_sse_message(snapshot_event))
                                 if event_type == "position_state" and isinstance(payload, dict):
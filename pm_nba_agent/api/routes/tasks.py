@@ -104,17 +104,6 @@ class TaskConfigResponse(BaseModel):
     config: dict[str, Any]
 
 
-SNAPSHOT_EVENT_NAMES = [
-    "polymarket_info",
-    "scoreboard",
-    "polymarket_book",
-    "auto_buy_state",
-    "auto_trade_state",
-    "auto_sell_state",
-    "position_state",
-]
-
-
 @router.post("/create", response_model=CreateTaskResponse)
 async def create_task(
     request: Request,
@@ -163,18 +152,16 @@ async def create_task(
         user_id=user_id,
     )
 
-    # 保存配置到 Redis
-    config_key = Channels.task_config(task_id)
-    await redis.set(config_key, config.to_json(), ex=86400)
-
     # 创建初始状态
     status = TaskStatus.create(task_id, user_id=user_id)
-    status_key = Channels.task_status(task_id)
-    await redis.set(status_key, status.to_json(), ex=86400)
 
-    # 添加到用户任务集合 + 全局任务集合
-    await redis.sadd(Channels.user_tasks(user_id), task_id)
-    await redis.sadd(Channels.all_tasks(), task_id)
+    # 保存配置与状态到 Redis，并添加到用户任务集合 + 全局任务集合（一次往返）
+    await redis.pipeline_exec([
+        ("set", (Channels.task_config(task_id), config.to_json()), {"ex": 86400}),
+        ("set", (Channels.task_status(task_id), status.to_json()), {"ex": 86400}),
+        ("sadd", (Channels.user_tasks(user_id), task_id)),
+        ("sadd", (Channels.all_tasks(), task_id)),
+    ])
 
     # 发送控制消息给 Worker
     control_message = json.dumps({
@@ -204,9 +191,8 @@ async def list_tasks(request: Request) -> TaskListResponse:
     task_ids = await redis.smembers(Channels.user_tasks(user_id))
     tasks: list[TaskStatusResponse] = []
 
-    for task_id in task_ids:
-        status_key = Channels.task_status(task_id)
-        data = await redis.get(status_key)
+    status_keys = [Channels.task_status(task_id) for task_id in task_ids]
+    for data in await redis.mget(status_keys):
         if data:
             status = TaskStatus.from_json(data)
             tasks.append(TaskStatusResponse(
@@ -316,8 +302,10 @@ async def delete_task(request: Request, task_id: str) -> dict[str, str]:
     keys_to_delete = [
         Channels.task_status(task_id),
         Channels.task_config(task_id),
+        Channels.task_snapshots(task_id),
     ]
-    for event_name in SNAPSHOT_EVENT_NAMES:
+    # 旧版本按事件名分别存储的快照 Key
+    for event_name in Channels.SNAPSHOT_EVENTS:
         keys_to_delete.append(Channels.task_snapshot(task_id, event_name))
 
     await redis.delete(*keys_to_delete)
@@ -234,7 +234,7 @@ class StrategyState:
             level_map.pop(price, None)
         else:
             level_map[price] = size
-        return [OrderLevel(price=p, size=s) for p, s in level_map.items()]
+        return [OrderLevel.from_pair(p, s) for p, s in level_map.items()]
 
     def build_snapshot(self) -> Optional[MarketSnapshot]:
         """构建市场快照"""
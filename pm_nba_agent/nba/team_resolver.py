@@ -1,11 +1,12 @@
 """NBA 球队信息解析"""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from nba_api.stats.static import teams
 
 
-@dataclass
+@dataclass(frozen=True)
 class TeamInfo:
     """球队信息"""
     id: int
@@ -17,6 +18,8 @@ class TeamInfo:
     year_founded: int
 
 
+# 静态球队表查询，结果按缩写缓存（TeamInfo 不可变，可安全共享）
+@lru_cache(maxsize=512)
 def get_team_info(abbreviation: str) -> Optional[TeamInfo]:
     """
     通过球队缩写获取详细信息
@@ -2,10 +2,16 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+# 路径中的 nba-{team1}-{team2}-{date} slug，不依赖固定前缀
+_EVENT_SLUG_RE = re.compile(r'/nba-([a-z]+)-([a-z]+)-(\d{4}-\d{2}-\d{2})')
+_TEAM_ABBR_RE = re.compile(r'[A-Z]{2,3}')
+
+
+@dataclass(frozen=True)
 class PolymarketEventInfo:
     """Polymarket 事件信息"""
     team1_abbr: str
@@ -14,6 +20,8 @@ class PolymarketEventInfo:
     url: str
 
 
+# 解析结果只取决于 URL，按 URL 缓存（PolymarketEventInfo 不可变，可安全共享）
+@lru_cache(maxsize=512)
 def parse_polymarket_url(url: str) -> Optional[PolymarketEventInfo]:
     """
     从 Polymarket URL 提取比赛信息
@@ -36,9 +44,7 @@ def parse_polymarket_url(url: str) -> Optional[PolymarketEventInfo]:
         >>> info.game_date
         '2026-01-26'
     """
-    # 匹配路径中的 nba-{team1}-{team2}-{date} slug，不依赖固定前缀
-    pattern = r'/nba-([a-z]+)-([a-z]+)-(\d{4}-\d{2}-\d{2})'
-    match = re.search(pattern, url.lower())
+    match = _EVENT_SLUG_RE.search(url.lower())
 
     if not match:
         return None
@@ -65,4 +71,4 @@ def validate_team_abbreviation(abbr: str) -> bool:
     Returns:
         True 如果格式有效
     """
-    return bool(re.match(r'^[A-Z]{2,3}$', abbr))
+    return _TEAM_ABBR_RE.fullmatch(abbr) is not None
@@ -15,7 +15,7 @@ from .models import (
     SignalEvent,
     SignalEventType,
 )
-from .positions import get_current_positions
+from .positions import get_current_positions, get_current_positions_batch
 from .resolver import MarketResolver
 from .ws_client import PolymarketWebSocketClient
 
@@ -44,4 +44,5 @@ __all__ = [
     # 工具
     "MarketResolver",
     "get_current_positions",
+    "get_current_positions_batch",
 ]
@@ -0,0 +1,73 @@
+"""Polymarket 元数据内存缓存
+
+市场 conditionId / clobTokenIds / outcomes 在事件生命周期内基本不变，
+缓存后可避免每次解析都请求 Gamma API。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Hashable, Optional
+
+
+class AsyncTTLCache:
+    """带过期时间的异步内存缓存
+
+    - 每个键独立过期时间，支持为负结果（如 404）设置更短的 TTL
+    - 按 LRU 淘汰，条目数不超过 maxsize
+    - single_flight() 为每个键提供一把锁，并发未命中只触发一次上游请求
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """读取缓存
+
+        Returns:
+            (是否命中, 缓存值)
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return False, None
+
+        self._data.move_to_end(key)
+        return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """写入缓存"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """删除缓存条目"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._data.clear()
+
+    @asynccontextmanager
+    async def single_flight(self, key: Hashable) -> AsyncIterator[None]:
+        """同一键的上游请求串行化（调用方在锁内需再次检查缓存）"""
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                yield
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
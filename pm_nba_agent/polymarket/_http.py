@@ -0,0 +1,119 @@
+"""Polymarket REST 共享 HTTP 客户端
+
+Gamma API 与 Data API 各复用一个带连接池的 httpx.AsyncClient，
+避免每次请求都重新建立 TCP + TLS 连接。Gamma API 启用 HTTP/2，
+resolve_event 并发发出的市场/事件请求可复用同一条连接。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import Any, Optional
+
+import httpx
+from loguru import logger
+
+from .config import (
+    POLYMARKET_DATA_API_URL,
+    POLYMARKET_GAMMA_API_URL,
+    POLYMARKET_TIMEOUTS,
+)
+
+
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60.0,
+)
+# httpx 的 HTTP/2 支持依赖 h2（py-clob-client 已通过 httpx[http2] 引入）
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 名称 -> (所属事件循环, 客户端)；AsyncClient 绑定创建时的事件循环
+_CLIENTS: dict[str, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _get_client(name: str, base_url: str, http2: bool = False) -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    cached = _CLIENTS.get(name)
+    if cached is not None:
+        cached_loop, client = cached
+        if cached_loop is loop and not client.is_closed:
+            return client
+
+    client = httpx.AsyncClient(
+        base_url=base_url.rstrip("/"),
+        limits=_LIMITS,
+        timeout=POLYMARKET_TIMEOUTS,
+        http2=http2 and _HTTP2_AVAILABLE,
+    )
+    _CLIENTS[name] = (loop, client)
+    return client
+
+
+def get_gamma_client() -> httpx.AsyncClient:
+    """获取 Gamma API 共享客户端"""
+    return _get_client("gamma", POLYMARKET_GAMMA_API_URL, http2=True)
+
+
+def get_data_client() -> httpx.AsyncClient:
+    """获取 Data API 共享客户端（HTTP/1.1，与 Gamma 分离避免相互阻塞）"""
+    return _get_client("data", POLYMARKET_DATA_API_URL)
+
+
+async def close_http_clients() -> None:
+    """关闭当前事件循环上的共享客户端（应用/Worker 退出时调用）"""
+    loop = asyncio.get_running_loop()
+    for name, (client_loop, client) in list(_CLIENTS.items()):
+        if client_loop is loop:
+            await client.aclose()
+        _CLIENTS.pop(name, None)
+
+
+async def fetch_json(
+    client: httpx.AsyncClient,
+    path: str,
+    *,
+    label: str,
+    params: Optional[dict[str, Any]] = None,
+    timeout: Optional[float | httpx.Timeout] = None,
+    allow_not_found: bool = False,
+) -> tuple[Any, Optional[int]]:
+    """GET 请求并解析 JSON，统一处理 httpx 异常与日志
+
+    Args:
+        client: 共享客户端
+        path: 相对路径
+        label: 日志中的请求描述（如 "持仓"、"市场详情"）
+        params: 查询参数
+        timeout: 单次请求超时，覆盖客户端默认值
+        allow_not_found: 为 True 时 404 不记为错误，由调用方处理
+
+    Returns:
+        (响应数据, HTTP 状态码)；失败时数据为 None，网络异常时状态码为 None
+    """
+    try:
+        logger.debug("请求{}: {} params={}", label, path, params)
+        if timeout is None:
+            response = await client.get(path, params=params)
+        else:
+            response = await client.get(path, params=params, timeout=timeout)
+        if allow_not_found and response.status_code == 404:
+            return None, 404
+        response.raise_for_status()
+        return response.json(), response.status_code
+    except httpx.HTTPStatusError as exc:
+        logger.error(
+            "HTTP 错误: {} - {}",
+            exc.response.status_code,
+            exc.response.text,
+        )
+        return None, exc.response.status_code
+    except httpx.RequestError as exc:
+        url = str(getattr(exc.request, "url", ""))
+        detail = f"{exc.__class__.__name__}: {exc!r}"
+        logger.error("请求失败: {} {}", url, detail)
+        return None, None
+    except Exception as exc:
+        logger.error("获取{}失败: {}", label, exc)
+        return None, None
@@ -16,6 +16,9 @@ from .config import (
 )
 
 
+_BOOK_EVENT_TYPES = frozenset({"book", "price_change"})
+
+
 class PolymarketBookStream:
     """Polymarket 订单簿消息订阅"""
 
@@ -119,7 +122,7 @@ class PolymarketBookStream:
     async def _handle_message(self, message: Any) -> None:
         if isinstance(message, dict):
             event_type = str(message.get("event_type", "")).lower()
-            if event_type and event_type not in {"book", "price_change"}:
+            if event_type and event_type not in _BOOK_EVENT_TYPES:
                 logger.debug("忽略非 book/price_change 消息: {}", event_type)
                 return
         await self._queue.put(message)
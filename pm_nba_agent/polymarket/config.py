@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import os
 
+import httpx
+
 
 POLYMARKET_PRIVATE_KEY = os.getenv("POLYMARKET_PRIVATE_KEY")
 POLYMARKET_PROXY_ADDRESS = os.getenv("POLYMARKET_PROXY_ADDRESS")
@@ -25,3 +27,6 @@ POLYMARKET_WSS_URL = os.getenv(
 POLYMARKET_WS_API_KEY = os.getenv("POLYMARKET_WS_API_KEY")
 POLYMARKET_WS_API_SECRET = os.getenv("POLYMARKET_WS_API_SECRET")
 POLYMARKET_WS_API_PASSPHRASE = os.getenv("POLYMARKET_WS_API_PASSPHRASE")
+
+# REST 超时：读取允许较慢响应，连接/连接池快速失败，避免策略循环长时间阻塞
+POLYMARKET_TIMEOUTS = httpx.Timeout(read=30.0, connect=5.0, write=10.0, pool=2.0)
@@ -23,6 +23,9 @@ from .positions import get_current_positions
 from .strategies import StrategyRegistry, TradingSignal, SignalType
 
 
+_BOOK_MESSAGE_TYPES = frozenset({"book", "price_change", "last_trade_price"})
+
+
 class ExecutionMode(Enum):
     """执行模式"""
 
@@ -218,7 +221,7 @@ class StrategyExecutor:
                     self.no_token_id,
                 )
                 logger.info(
-                    "持仓同步完成: YES=%.2f, NO=%.2f",
+                    "持仓同步完成: YES={:.2f}, NO={:.2f}",
                     self._position.yes_size,
                     self._position.no_size,
                 )
@@ -268,7 +271,7 @@ class StrategyExecutor:
 
         # 解析消息类型
         msg_type = message.get("event_type") or message.get("type")
-        if msg_type not in ("book", "price_change", "last_trade_price"):
+        if msg_type not in _BOOK_MESSAGE_TYPES:
             return
 
         # 更新订单簿缓存
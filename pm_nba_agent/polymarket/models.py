@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import time
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
@@ -81,7 +83,7 @@ class EventInfo:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderLevel:
     """订单簿单层"""
 
@@ -95,6 +97,11 @@ class OrderLevel:
             size=float(raw.get("size", 0)),
         )
 
+    @classmethod
+    def from_pair(cls, price: Any, size: Any) -> "OrderLevel":
+        """从 (price, size) 原始值创建，跳过字典查找"""
+        return cls(float(price), float(size))
+
 
 @dataclass
 class SideData:
@@ -149,16 +156,19 @@ class MarketSnapshot:
         return yes_ask + no_ask
 
     def to_dict(self) -> dict[str, Any]:
+        # best_ask 需扫描整个卖盘，这里只计算一次并复用于 price_sum
+        yes_best_ask = self.yes_data.best_ask
+        no_best_ask = self.no_data.best_ask
         return {
             "yes_token_id": self.yes_data.token_id,
             "no_token_id": self.no_data.token_id,
             "yes_price": self.yes_data.price,
             "no_price": self.no_data.price,
             "yes_best_bid": self.yes_data.best_bid,
-            "yes_best_ask": self.yes_data.best_ask,
+            "yes_best_ask": yes_best_ask,
             "no_best_bid": self.no_data.best_bid,
-            "no_best_ask": self.no_data.best_ask,
-            "price_sum": self.price_sum,
+            "no_best_ask": no_best_ask,
+            "price_sum": (yes_best_ask or self.yes_data.price) + (no_best_ask or self.no_data.price),
             "timestamp": self.timestamp,
         }
 
@@ -224,6 +234,15 @@ class OrderBookContext:
         }
 
 
+# 方向 -> (份额, 总成本, 均价) 字段名
+_POSITION_FIELDS: dict[str, tuple[str, str, str]] = {
+    "YES": ("yes_size", "yes_total_cost", "yes_avg_cost"),
+    "NO": ("no_size", "no_total_cost", "no_avg_cost"),
+    "yes": ("yes_size", "yes_total_cost", "yes_avg_cost"),
+    "no": ("no_size", "no_total_cost", "no_avg_cost"),
+}
+
+
 @dataclass
 class PositionContext:
     """持仓上下文
@@ -276,31 +295,23 @@ class PositionContext:
             price: 成交价格
             is_buy: 是否为买入
         """
-        side = side.upper()
-        if side == "YES":
-            if is_buy:
-                new_cost = self.yes_total_cost + size * price
-                new_size = self.yes_size + size
-                self.yes_total_cost = new_cost
-                self.yes_size = new_size
-                self.yes_avg_cost = new_cost / new_size if new_size > 0 else 0
-            else:
-                self.yes_size = max(0, self.yes_size - size)
-                if self.yes_size == 0:
-                    self.yes_total_cost = 0
-                    self.yes_avg_cost = 0
-        elif side == "NO":
-            if is_buy:
-                new_cost = self.no_total_cost + size * price
-                new_size = self.no_size + size
-                self.no_total_cost = new_cost
-                self.no_size = new_size
-                self.no_avg_cost = new_cost / new_size if new_size > 0 else 0
-            else:
-                self.no_size = max(0, self.no_size - size)
-                if self.no_size == 0:
-                    self.no_total_cost = 0
-                    self.no_avg_cost = 0
+        fields = _POSITION_FIELDS.get(side) or _POSITION_FIELDS.get(side.upper())
+        if fields is None:
+            return
+        size_attr, cost_attr, avg_attr = fields
+
+        if is_buy:
+            new_cost = getattr(self, cost_attr) + size * price
+            new_size = getattr(self, size_attr) + size
+            setattr(self, cost_attr, new_cost)
+            setattr(self, size_attr, new_size)
+            setattr(self, avg_attr, new_cost / new_size if new_size > 0 else 0)
+        else:
+            new_size = max(0, getattr(self, size_attr) - size)
+            setattr(self, size_attr, new_size)
+            if new_size == 0:
+                setattr(self, cost_attr, 0)
+                setattr(self, avg_attr, 0)
 
     @classmethod
     def from_api_positions(
@@ -311,19 +322,22 @@ class PositionContext:
     ) -> "PositionContext":
         """从 API 持仓数据创建上下文"""
         ctx = cls()
+        dispatch = {
+            yes_token_id: _POSITION_FIELDS["YES"],
+            no_token_id: _POSITION_FIELDS["NO"],
+        }
         for pos in positions:
             token_id = pos.get("asset") or pos.get("token_id")
+            fields = dispatch.get(token_id)
+            if fields is None:
+                continue
+
             size = float(pos.get("size", 0))
             avg_price = float(pos.get("avgPrice", 0) or pos.get("avg_price", 0))
-
-            if token_id == yes_token_id:
-                ctx.yes_size = size
-                ctx.yes_avg_cost = avg_price
-                ctx.yes_total_cost = size * avg_price
-            elif token_id == no_token_id:
-                ctx.no_size = size
-                ctx.no_avg_cost = avg_price
-                ctx.no_total_cost = size * avg_price
+            size_attr, cost_attr, avg_attr = fields
+            setattr(ctx, size_attr, size)
+            setattr(ctx, avg_attr, avg_price)
+            setattr(ctx, cost_attr, size * avg_price)
 
         return ctx
 
@@ -344,6 +358,15 @@ class PositionContext:
 # =============================================================================
 
 
+# json.dumps 传入非默认参数时每次都会新建 JSONEncoder，这里复用同一个实例
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _now_ms() -> int:
+    """当前时间戳（毫秒）"""
+    return time.time_ns() // 1_000_000
+
+
 class SignalEventType:
     """信号事件类型"""
 
@@ -354,7 +377,7 @@ class SignalEventType:
     STATUS = "status"  # 状态更新
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalEvent:
     """信号事件（用于推送前端）
 
@@ -379,6 +402,7 @@ class SignalEvent:
     execution: Optional[dict[str, Any]] = None
     strategy: Optional[dict[str, Any]] = None
     error: Optional[str] = None
+    _json_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_signal(
@@ -399,20 +423,8 @@ class SignalEvent:
         metadata: Optional[dict[str, Any]] = None,
     ) -> "SignalEvent":
         """从信号数据创建事件"""
-        import time
-
-        # 市场摘要
-        market_data = {
-            "yes_token_id": snapshot.yes_data.token_id,
-            "no_token_id": snapshot.no_data.token_id,
-            "yes_price": snapshot.yes_data.price,
-            "no_price": snapshot.no_data.price,
-            "yes_best_bid": snapshot.yes_data.best_bid,
-            "yes_best_ask": snapshot.yes_data.best_ask,
-            "no_best_bid": snapshot.no_data.best_bid,
-            "no_best_ask": snapshot.no_data.best_ask,
-            "price_sum": snapshot.price_sum,
-        }
+        # 市场摘要（复用快照序列化，best bid/ask 各只计算一次）
+        market_data = snapshot.to_dict()
 
         # 信号数据
         signal_data = {
@@ -443,7 +455,7 @@ class SignalEvent:
 
         return cls(
             event_type=SignalEventType.SIGNAL,
-            timestamp=int(time.time() * 1000),
+            timestamp=_now_ms(),
             signal=signal_data,
             market=market_data,
             position=position.to_dict(),
@@ -463,8 +475,6 @@ class SignalEvent:
         error: Optional[str] = None,
     ) -> "SignalEvent":
         """从订单执行结果创建事件"""
-        import time
-
         market_data = {
             "yes_price": snapshot.yes_data.price,
             "no_price": snapshot.no_data.price,
@@ -479,7 +489,7 @@ class SignalEvent:
 
         return cls(
             event_type=SignalEventType.ORDER,
-            timestamp=int(time.time() * 1000),
+            timestamp=_now_ms(),
             market=market_data,
             position=position.to_dict(),
             execution=execution_data,
@@ -489,11 +499,9 @@ class SignalEvent:
     @classmethod
     def from_error(cls, error: str, context: Optional[dict[str, Any]] = None) -> "SignalEvent":
         """创建错误事件"""
-        import time
-
         return cls(
             event_type=SignalEventType.ERROR,
-            timestamp=int(time.time() * 1000),
+            timestamp=_now_ms(),
             error=error,
             execution={"success": False, "error": error, "context": context},
         )
@@ -501,11 +509,9 @@ class SignalEvent:
     @classmethod
     def status(cls, message: str, data: Optional[dict[str, Any]] = None) -> "SignalEvent":
         """创建状态事件"""
-        import time
-
         return cls(
             event_type=SignalEventType.STATUS,
-            timestamp=int(time.time() * 1000),
+            timestamp=_now_ms(),
             signal={"type": "STATUS", "reason": message, "metadata": data or {}},
         )
 
@@ -523,7 +529,11 @@ class SignalEvent:
         }
 
     def to_json(self) -> str:
-        """转换为 JSON 字符串"""
-        import json
+        """转换为 JSON 字符串
 
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        事件创建后即视为不可变快照，序列化结果按实例缓存，
+        重复推送（重连、多订阅者）时不再重复编码。
+        """
+        if self._json_cache is None:
+            self._json_cache = _JSON_ENCODER.encode(self.to_dict())
+        return self._json_cache
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Optional, cast
 
 from loguru import logger
@@ -16,18 +17,44 @@ _SIDE_MAP = {
     "BUY": BUY,
     "SELL": SELL,
 }
+_VALID_ORDER_TYPES = frozenset({"GTC", "GTD"})
+# 规范写法的快速查表，命中时跳过 strip()/upper() 的字符串分配
+_SIDE_FAST = {"BUY": "BUY", "SELL": "SELL", "buy": "BUY", "sell": "SELL"}
+_ORDER_TYPE_FAST = {"GTC": "GTC", "GTD": "GTD", "gtc": "GTC", "gtd": "GTD"}
+_ERROR_ATTRS = ("message", "detail", "error", "reason", "error_msg", "status_code")
+
+
+class OrderError(ValueError):
+    """下单/签名失败
+
+    仅保存上下文字段，完整错误信息在 str() 时才格式化；
+    继承 ValueError 以兼容现有的异常捕获。
+    """
+
+    __slots__ = ("summary", "fields")
+
+    def __init__(self, summary: str, **fields: Any) -> None:
+        super().__init__(summary)
+        self.summary = summary
+        self.fields = fields
+
+    def __str__(self) -> str:
+        details = ", ".join(f"{key}={value}" for key, value in self.fields.items())
+        return f"{self.summary}: {details}"
 
 
 def _format_clob_error(exc: Exception) -> str:
     details: list[str] = []
     details.append(f"type={type(exc).__name__}")
 
-    for attr in ("message", "detail", "error", "reason"):
-        value = getattr(exc, attr, None)
-        if value:
-            details.append(f"{attr}={value}")
+    # 异常附加信息都存放在实例字典中（含 py_clob_client 的 PolyApiException），
+    # 一次取出后按键查找，避免逐个 getattr 探测
+    attrs: dict[str, Any] = getattr(exc, "__dict__", {})
+    details.extend(
+        f"{attr}={attrs[attr]}" for attr in _ERROR_ATTRS if attrs.get(attr)
+    )
 
-    response = getattr(exc, "response", None)
+    response = attrs.get("response")
     if response is not None:
         status_code = getattr(response, "status_code", None)
         if status_code is not None:
@@ -35,14 +62,16 @@ def _format_clob_error(exc: Exception) -> str:
         text = getattr(response, "text", None)
         if text:
             details.append(f"response_text={text}")
-        json_payload = None
-        if hasattr(response, "json"):
+        headers = getattr(response, "headers", None) or {}
+        content_type = str(headers.get("content-type", ""))
+        # 仅在响应声明为 JSON 时才解析，HTML/纯文本错误页已包含在 response_text 中
+        if content_type.startswith("application/json") and hasattr(response, "json"):
             try:
                 json_payload = response.json()
             except Exception:
                 json_payload = None
-        if json_payload is not None:
-            details.append(f"response_json={json_payload}")
+            if json_payload is not None:
+                details.append(f"response_json={json_payload}")
 
     if exc.args:
         details.append(f"args={exc.args}")
@@ -60,6 +89,9 @@ def _validate_basic_inputs(token_id: str, price: float, size: float) -> None:
 
 
 def _normalize_side(side: str) -> str:
+    normalized = _SIDE_FAST.get(side)
+    if normalized is not None:
+        return normalized
     normalized = side.strip().upper()
     if normalized not in _SIDE_MAP:
         raise ValueError("side 仅支持 BUY 或 SELL")
@@ -67,12 +99,54 @@ def _normalize_side(side: str) -> str:
 
 
 def _normalize_order_type(order_type: str) -> str:
+    normalized = _ORDER_TYPE_FAST.get(order_type)
+    if normalized is not None:
+        return normalized
     normalized = order_type.strip().upper()
-    if normalized not in {"GTC", "GTD"}:
+    if normalized not in _VALID_ORDER_TYPES:
         raise ValueError("order_type 仅支持 GTC 或 GTD")
     return normalized
 
 
+def _build_order_args(order: dict[str, Any], index: int) -> tuple[OrderArgs, str]:
+    """单次遍历完成批量订单项的字段读取、规范化与校验
+
+    Returns:
+        (OrderArgs, 订单类型)
+    """
+    try:
+        token_id = order["token_id"]
+        side = _normalize_side(order["side"])
+        order_type = _normalize_order_type(order.get("order_type", "GTC"))
+        price = float(order["price"])
+        size = float(order["size"])
+    except KeyError as exc:
+        raise ValueError(f"orders[{index}] 缺少字段 {exc}") from exc
+
+    _validate_basic_inputs(token_id, price, size)
+
+    expiration = order.get("expiration")
+    if order_type == "GTD" and not expiration:
+        raise ValueError(f"orders[{index}] GTD 订单必须提供 expiration")
+
+    return _make_order_args(token_id, _SIDE_MAP[side], price, size, expiration), order_type
+
+
+def _make_order_args(
+    token_id: str,
+    side: str,
+    price: float,
+    size: float,
+    expiration: Any,
+) -> OrderArgs:
+    # 固定字段直接按关键字构造，避免中间 dict 与 ** 解包
+    if expiration:
+        return OrderArgs(
+            price=price, size=size, side=side, token_id=token_id, expiration=expiration
+        )
+    return OrderArgs(price=price, size=size, side=side, token_id=token_id)
+
+
 async def create_polymarket_order(
     *,
     token_id: str,
@@ -97,17 +171,10 @@ async def create_polymarket_order(
         missing_key_message="POLYMARKET_PRIVATE_KEY 未配置",
     )
 
-    order_kwargs: dict[str, Any] = {
-        "price": price,
-        "size": size,
-        "side": _SIDE_MAP[normalized_side],
-        "token_id": token_id,
-    }
-    if expiration:
-        order_kwargs["expiration"] = expiration
-
     try:
-        order_args = OrderArgs(**order_kwargs)
+        order_args = _make_order_args(
+            token_id, _SIDE_MAP[normalized_side], price, size, expiration
+        )
         signed_order = client.create_order(order_args)
         order_type_value = "GTC" if normalized_order_type == "GTC" else "GTD"
         result = client.post_order(signed_order, cast(Any, order_type_value))
@@ -122,11 +189,16 @@ async def create_polymarket_order(
             "下单失败: token_id={}, side={}, price={}, size={}, order_type={}, error={}, details={}",
             token_id, normalized_side, price, size, normalized_order_type, exc, error_details,
         )
-        raise ValueError(
-            "Polymarket 下单失败: "
-            f"token_id={token_id}, side={normalized_side}, price={price}, size={size}, "
-            f"order_type={normalized_order_type}, expiration={expiration}, error={exc}, "
-            f"details={error_details}"
+        raise OrderError(
+            "Polymarket 下单失败",
+            token_id=token_id,
+            side=normalized_side,
+            price=price,
+            size=size,
+            order_type=normalized_order_type,
+            expiration=expiration,
+            error=exc,
+            details=error_details,
         ) from exc
 
 
@@ -145,55 +217,54 @@ async def create_polymarket_orders_batch(
         missing_key_message="POLYMARKET_PRIVATE_KEY 未配置",
     )
 
-    post_orders: list[PostOrdersArgs] = []
-    for index, order in enumerate(orders, start=1):
-        try:
-            token_id = order["token_id"]
-            side = _normalize_side(order["side"])
-            order_type = _normalize_order_type(order.get("order_type", "GTC"))
-            price = float(order["price"])
-            size = float(order["size"])
-            expiration = order.get("expiration")
-        except KeyError as exc:
-            raise ValueError(f"orders[{index}] 缺少字段 {exc}") from exc
-
-        _validate_basic_inputs(token_id, price, size)
-
-        if order_type == "GTD" and not expiration:
-            raise ValueError(f"orders[{index}] GTD 订单必须提供 expiration")
-
-        order_kwargs: dict[str, Any] = {
-            "price": price,
-            "size": size,
-            "side": _SIDE_MAP[side],
-            "token_id": token_id,
-        }
-        if expiration:
-            order_kwargs["expiration"] = expiration
+    # 先同步完成全部校验，任一订单非法时不触发签名
+    prepared = [
+        _build_order_args(order, index)
+        for index, order in enumerate(orders, start=1)
+    ]
 
+    def _sign_order(index: int, order_args: OrderArgs, order_type: str) -> PostOrdersArgs:
         try:
-            order_args = OrderArgs(**order_kwargs)
             signed_order = client.create_order(order_args)
             order_type_value = "GTC" if order_type == "GTC" else "GTD"
-            post_orders.append(
-                PostOrdersArgs(
-                    order=signed_order,
-                    orderType=cast(Any, order_type_value),
-                )
+            return PostOrdersArgs(
+                order=signed_order,
+                orderType=cast(Any, order_type_value),
             )
         except Exception as exc:
+            token_id = order_args.token_id
+            side = order_args.side
+            price = order_args.price
+            size = order_args.size
+            expiration = order_args.expiration or None
             error_details = _format_clob_error(exc)
             logger.error(
                 "订单签名失败: orders[{}] token_id={}, side={}, price={}, size={}, error={}, details={}",
                 index, token_id, side, price, size, exc, error_details,
             )
-            raise ValueError(
-                "Polymarket 订单签名失败: "
-                f"orders[{index}] token_id={token_id}, side={side}, price={price}, size={size}, "
-                f"order_type={order_type}, expiration={expiration}, error={exc}, "
-                f"details={error_details}"
+            raise OrderError(
+                f"Polymarket 订单签名失败: orders[{index}]",
+                token_id=token_id,
+                side=side,
+                price=price,
+                size=size,
+                order_type=order_type,
+                expiration=expiration,
+                error=exc,
+                details=error_details,
             ) from exc
 
+    # 各订单签名相互独立（EIP-712 签名 + tick size 查询），放到线程池并发执行，
+    # 避免阻塞事件循环；gather 保持返回顺序与 orders 一致
+    post_orders: list[PostOrdersArgs] = list(
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(_sign_order, index, order_args, order_type)
+                for index, (order_args, order_type) in enumerate(prepared, start=1)
+            )
+        )
+    )
+
     try:
         result = client.post_orders(post_orders)
         logger.info("批量下单成功: count={}", len(post_orders))
@@ -204,7 +275,9 @@ async def create_polymarket_orders_batch(
             "批量下单失败: count={}, error={}, details={}",
             len(post_orders), exc, error_details,
         )
-        raise ValueError(
-            "Polymarket 批量下单失败: "
-            f"count={len(post_orders)}, error={exc}, details={error_details}"
+        raise OrderError(
+            "Polymarket 批量下单失败",
+            count=len(post_orders),
+            error=exc,
+            details=error_details,
         ) from exc
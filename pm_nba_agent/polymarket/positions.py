@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Optional
 
 import httpx
 from loguru import logger
 
-from .config import POLYMARKET_DATA_API_URL, POLYMARKET_PROXY_ADDRESS
+from ._http import fetch_json, get_data_client
+from .config import POLYMARKET_PROXY_ADDRESS
 
 
 def _resolve_user_address(
@@ -24,7 +26,9 @@ def _resolve_user_address(
 def _join_list(values: Optional[list[Any]]) -> Optional[str]:
     if not values:
         return None
-    return ",".join(str(value) for value in values)
+    if all(type(value) is str for value in values):
+        return ",".join(values)
+    return ",".join([str(value) for value in values])
 
 
 async def get_current_positions(
@@ -41,6 +45,7 @@ async def get_current_positions(
     sort_direction: Optional[str] = None,
     title: Optional[str] = None,
     proxy_address: Optional[str] = None,
+    timeout: Optional[float | httpx.Timeout] = None,
 ) -> Optional[list[dict[str, Any]]]:
     """查询用户当前持仓
 
@@ -60,6 +65,7 @@ async def get_current_positions(
         sort_direction: 排序方向。
         title: 标题过滤（前缀匹配）。
         proxy_address: 代理钱包地址（可覆盖环境变量）。
+        timeout: 单次请求超时，覆盖共享客户端默认值（如大批量查询）。
 
     Returns:
         持仓列表；失败时返回 None。
@@ -96,30 +102,47 @@ async def get_current_positions(
     if title:
         params["title"] = title
 
-    url = f"{POLYMARKET_DATA_API_URL.rstrip('/')}/positions"
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            logger.debug("请求持仓: {} params={}", url, params)
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            if not isinstance(data, list):
-                logger.warning("持仓响应非列表: {}", type(data))
-                return None
-            return data
-        except httpx.HTTPStatusError as exc:
-            logger.error(
-                "HTTP 错误: {} - {}",
-                exc.response.status_code,
-                exc.response.text,
-            )
-            return None
-        except httpx.RequestError as exc:
-            url = str(getattr(exc.request, "url", ""))
-            detail = f"{exc.__class__.__name__}: {exc!r}"
-            logger.error("请求失败: {} {}", url, detail)
-            return None
-        except Exception as exc:
-            logger.error("获取持仓失败: {}", exc)
-            return None
+    data, _ = await fetch_json(
+        get_data_client(),
+        "/positions",
+        label="持仓",
+        params=params,
+        timeout=timeout,
+    )
+    if data is None:
+        return None
+    if not isinstance(data, list):
+        logger.warning("持仓响应非列表: {}", type(data))
+        return None
+    return data
+
+
+async def get_current_positions_batch(
+    condition_id_groups: list[list[str]],
+    *,
+    max_concurrency: int = 10,
+    **kwargs: Any,
+) -> list[Optional[list[dict[str, Any]]] | BaseException]:
+    """并发查询多组 condition_id 的持仓
+
+    每组对应一次 get_current_positions 调用，共享 Data API 连接池，
+    并通过信号量限制并发，避免耗尽连接池。
+
+    Args:
+        condition_id_groups: condition_id 分组列表（通常每个事件一组）。
+        max_concurrency: 最大并发请求数。
+        **kwargs: 透传给 get_current_positions 的其他参数（不含 condition_ids）。
+
+    Returns:
+        与输入分组一一对应的结果列表；单组失败时对应位置为异常对象。
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch(condition_ids: list[str]) -> Optional[list[dict[str, Any]]]:
+        async with semaphore:
+            return await get_current_positions(condition_ids=condition_ids, **kwargs)
+
+    return await asyncio.gather(
+        *(_fetch(group) for group in condition_id_groups),
+        return_exceptions=True,
+    )
@@ -2,17 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+from functools import lru_cache
 from typing import Any, Optional
 
-import httpx
 from loguru import logger
 
-from .config import POLYMARKET_GAMMA_API_URL
+from ._cache import AsyncTTLCache
+from ._http import fetch_json, get_gamma_client
 from .models import EventInfo, TokenInfo, MarketInfo
 
 
+# 市场/事件元数据在比赛期间基本不变：正结果缓存 10 分钟，404 缓存 5 分钟
+SLUG_CACHE_TTL = 600.0
+SLUG_NEGATIVE_CACHE_TTL = 300.0
+_SLUG_CACHE = AsyncTTLCache(ttl=SLUG_CACHE_TTL, maxsize=512)
+
+
+def _first(data: dict, *keys: str) -> Any:
+    """按顺序返回第一个非空字段值（兼容 camelCase / snake_case 字段名）"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
+@lru_cache(maxsize=256)
+def _decode_list_string(value: str) -> tuple[str, ...]:
+    """解析 JSON 字符串形式的列表字段（如 clobTokenIds、outcomes）
+
+    同一市场每次解析得到的字符串完全相同，按原始字符串缓存解码结果。
+    """
+    try:
+        parsed = json.loads(value)
+    except json.JSONDecodeError:
+        return ()
+    if isinstance(parsed, list):
+        return tuple(str(item) for item in parsed)
+    return ()
+
+
 class MarketResolver:
     """Polymarket 事件和市场解析工具
 
@@ -25,6 +57,8 @@ class MarketResolver:
     # - /{lang}/sports/nba/{slug}
     # - /{lang}/event/{slug}
     EVENT_URL_PATTERN = r"https://polymarket\.com/(?:[a-z]{2}/)?(?:event|sports/[a-z0-9]+)/([a-z0-9\-]+)"
+    _EVENT_URL_RE = re.compile(EVENT_URL_PATTERN, re.ASCII)
+    _BARE_ID_RE = re.compile(r"[a-z0-9\-]+", re.ASCII)
 
     @staticmethod
     def parse_event_url(url: str) -> Optional[str]:
@@ -37,72 +71,69 @@ class MarketResolver:
         - URL: https://polymarket.com/zh/event/nba-bos-lal-2026-02-22
         - 直接 ID: nba-bos-lal-2026-02-22
         """
-        match = re.search(MarketResolver.EVENT_URL_PATTERN, url)
+        match = MarketResolver._EVENT_URL_RE.search(url)
         if match:
             return match.group(1)
 
-        if re.match(r"^[a-z0-9\-]+$", url):
+        if MarketResolver._BARE_ID_RE.fullmatch(url):
             return url
 
         return None
 
     @staticmethod
-    async def get_market_by_slug(slug: str) -> Optional[dict]:
-        """通过 slug 获取市场详情"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                url = f"{POLYMARKET_GAMMA_API_URL}/markets/slug/{slug}"
-                logger.debug("请求市场详情: {}", url)
-                response = await client.get(url)
-                if response.status_code == 404:
-                    logger.warning("市场不存在: {}", slug)
-                    return None
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as exc:
-                logger.error(
-                    "HTTP 错误: {} - {}",
-                    exc.response.status_code,
-                    exc.response.text,
-                )
-                return None
-            except httpx.RequestError as exc:
-                url = str(getattr(exc.request, "url", ""))
-                detail = f"{exc.__class__.__name__}: {exc!r}"
-                logger.error("请求失败: {} {}", url, detail)
-                return None
-            except Exception as exc:
-                logger.error("获取市场详情失败: {}", exc)
-                return None
+    async def get_market_by_slug(slug: str, refresh: bool = False) -> Optional[dict]:
+        """通过 slug 获取市场详情（带 TTL 缓存，refresh=True 时强制重新请求）"""
+        return await MarketResolver._get_slug_cached("markets", "市场", slug, refresh)
 
     @staticmethod
-    async def get_event_by_slug(slug: str) -> Optional[dict]:
-        """通过 slug 获取事件详情"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                url = f"{POLYMARKET_GAMMA_API_URL}/events/slug/{slug}"
-                logger.debug("请求事件详情: {}", url)
-                response = await client.get(url)
-                if response.status_code == 404:
-                    logger.warning("事件不存在: {}", slug)
-                    return None
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as exc:
-                logger.error(
-                    "HTTP 错误: {} - {}",
-                    exc.response.status_code,
-                    exc.response.text,
-                )
-                return None
-            except httpx.RequestError as exc:
-                url = str(getattr(exc.request, "url", ""))
-                detail = f"{exc.__class__.__name__}: {exc!r}"
-                logger.error("请求失败: {} {}", url, detail)
-                return None
-            except Exception as exc:
-                logger.error("获取事件详情失败: {}", exc)
-                return None
+    async def get_event_by_slug(slug: str, refresh: bool = False) -> Optional[dict]:
+        """通过 slug 获取事件详情（带 TTL 缓存，refresh=True 时强制重新请求）"""
+        return await MarketResolver._get_slug_cached("events", "事件", slug, refresh)
+
+    @staticmethod
+    async def _get_slug_cached(
+        path: str,
+        label: str,
+        slug: str,
+        refresh: bool,
+    ) -> Optional[dict]:
+        key = (path, slug)
+        if not refresh:
+            hit, value = _SLUG_CACHE.get(key)
+            if hit:
+                return value
+
+        async with _SLUG_CACHE.single_flight(key):
+            # 等锁期间可能已有并发请求写入缓存
+            if not refresh:
+                hit, value = _SLUG_CACHE.get(key)
+                if hit:
+                    return value
+
+            data, not_found = await MarketResolver._fetch_slug(path, label, slug)
+            if data is not None:
+                _SLUG_CACHE.set(key, data)
+            elif not_found:
+                _SLUG_CACHE.set(key, None, ttl=SLUG_NEGATIVE_CACHE_TTL)
+            return data
+
+    @staticmethod
+    async def _fetch_slug(path: str, label: str, slug: str) -> tuple[Optional[dict], bool]:
+        """请求 Gamma API
+
+        Returns:
+            (响应数据, 是否 404)；网络错误等临时失败不视为 404，不做负缓存
+        """
+        data, status_code = await fetch_json(
+            get_gamma_client(),
+            f"/{path}/slug/{slug}",
+            label=f"{label}详情",
+            allow_not_found=True,
+        )
+        if status_code == 404:
+            logger.warning("{}不存在: {}", label, slug)
+            return None, True
+        return data, False
 
     @staticmethod
     def _parse_list_field(value: Any) -> list[str]:
@@ -111,12 +142,7 @@ class MarketResolver:
         if isinstance(value, list):
             return [str(item) for item in value]
         if isinstance(value, str):
-            try:
-                parsed = json.loads(value)
-                if isinstance(parsed, list):
-                    return [str(item) for item in parsed]
-            except json.JSONDecodeError:
-                return []
+            return list(_decode_list_string(value))
         return []
 
     @staticmethod
@@ -134,23 +160,19 @@ class MarketResolver:
         if not market_data:
             return None, [], None, None
 
-        condition_id = market_data.get("conditionId") or market_data.get("condition_id")
+        condition_id = _first(market_data, "conditionId", "condition_id")
         outcomes = MarketResolver._parse_list_field(market_data.get("outcomes"))
         token_ids = MarketResolver._parse_list_field(
-            market_data.get("clobTokenIds") or market_data.get("clob_token_ids")
+            _first(market_data, "clobTokenIds", "clob_token_ids")
         )
-        question = market_data.get("question") or market_data.get("title")
-        description = market_data.get("description") or market_data.get("details")
+        question = _first(market_data, "question", "title")
+        description = _first(market_data, "description", "details")
         market_slug = market_data.get("slug") or slug
-        market_id = (
-            market_data.get("id")
-            or market_data.get("marketId")
-            or market_data.get("market_id")
-        )
+        market_id = _first(market_data, "id", "marketId", "market_id")
 
+        # 缺少 outcome 的 token 会被跳过，因此 zip 截断到较短者即可
         tokens: list[TokenInfo] = []
-        for idx, token_id in enumerate(token_ids):
-            outcome_raw = outcomes[idx] if idx < len(outcomes) else ""
+        for token_id, outcome_raw in zip(token_ids, outcomes):
             outcome = MarketResolver._normalize_outcome(outcome_raw)
             if not outcome:
                 continue
@@ -163,7 +185,7 @@ class MarketResolver:
                 )
             )
 
-        title = question or market_data.get("title")
+        title = question
         market_info = MarketInfo(
             slug=market_slug,
             question=question,
@@ -207,7 +229,8 @@ class MarketResolver:
     @staticmethod
     def extract_event_metadata(event_id: str) -> tuple[str, str]:
         """从事件 ID 提取元信息"""
-        parts = event_id.split("-")
+        # 只需要前三段，限制切分次数避免为长尾部分分配字符串
+        parts = event_id.split("-", 3)
 
         asset = "UNKNOWN"
         interval = "15m"
@@ -219,8 +242,18 @@ class MarketResolver:
         return asset, interval
 
     @staticmethod
-    async def resolve_event(event_url_or_id: str) -> Optional[EventInfo]:
-        """完整解析事件信息"""
+    async def resolve_event(
+        event_url_or_id: str,
+        race_fallback: bool = True,
+    ) -> Optional[EventInfo]:
+        """完整解析事件信息
+
+        Args:
+            event_url_or_id: 事件 URL 或 ID
+            race_fallback: 是否并发请求市场与事件详情。slug 为事件 slug 时
+                市场接口通常 404，并发可省去一次串行往返；为 False 时
+                仅在市场查询失败后才请求事件详情。
+        """
         event_id = MarketResolver.parse_event_url(event_url_or_id)
         if not event_id:
             logger.error("无法解析事件标识: {}", event_url_or_id)
@@ -228,11 +261,20 @@ class MarketResolver:
 
         asset, interval = MarketResolver.extract_event_metadata(event_id)
 
-        market_data = await MarketResolver.get_market_by_slug(event_id)
         event_data: Optional[dict] = None
-        if not market_data:
-            event_data = await MarketResolver.get_event_by_slug(event_id)
-            market_data = MarketResolver._select_market_from_event(event_data)
+        if race_fallback:
+            market_data, fallback_event_data = await asyncio.gather(
+                MarketResolver.get_market_by_slug(event_id),
+                MarketResolver.get_event_by_slug(event_id),
+            )
+            if not market_data:
+                event_data = fallback_event_data
+                market_data = MarketResolver._select_market_from_event(event_data)
+        else:
+            market_data = await MarketResolver.get_market_by_slug(event_id)
+            if not market_data:
+                event_data = await MarketResolver.get_event_by_slug(event_id)
+                market_data = MarketResolver._select_market_from_event(event_data)
 
         condition_id, tokens, title, market_info = MarketResolver._extract_market_info(
             market_data,
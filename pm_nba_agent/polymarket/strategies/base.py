@@ -4,25 +4,30 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from ..models import OrderBookContext, PositionContext, MarketSnapshot
 
 
-class SignalType(Enum):
-    """交易信号类型"""
+class SignalType(StrEnum):
+    """交易信号类型
+
+    StrEnum 成员本身即字符串，可直接与 "BUY" 等比较并参与 JSON 序列化。
+    """
 
     BUY = "BUY"
     SELL = "SELL"
     HOLD = "HOLD"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignal:
     """策略生成的交易信号
 
+    使用 __slots__ 布局，子类如需新增字段同样需要声明为 slots dataclass。
+
     Attributes:
         signal_type: 信号类型（BUY/SELL/HOLD）
         yes_size: YES/UP 方向份额
@@ -52,7 +57,7 @@ class TradingSignal:
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "signal_type": self.signal_type.value,
+            "signal_type": self.signal_type,
             "yes_size": self.yes_size,
             "no_size": self.no_size,
             "yes_price": self.yes_price,
@@ -62,6 +67,10 @@ class TradingSignal:
         }
 
 
+# 每个策略实例缓存的参数组合上限（策略实例为单例，参数组合通常很少）
+_PREPARED_PARAMS_MAXSIZE = 16
+
+
 class BaseStrategy(ABC):
     """策略抽象基类
 
@@ -90,6 +99,31 @@ class BaseStrategy(ABC):
         """策略描述"""
         return self.__class__.__doc__ or ""
 
+    def prepare_params(self, params: dict[str, Any]) -> Any:
+        """将原始参数解析为策略内部使用的形式
+
+        子类可覆盖此方法完成默认值填充与类型转换，结果经 resolve_params
+        按参数内容缓存，避免每个 tick 重复 dict 查找与 float() 转换。
+        默认原样返回。
+        """
+        return params
+
+    def resolve_params(self, params: dict[str, Any]) -> Any:
+        """获取（缓存的）预处理参数"""
+        try:
+            key = frozenset(params.items())
+        except TypeError:
+            # 参数含不可哈希的值，无法缓存
+            return self.prepare_params(params)
+
+        cache: dict[frozenset, Any] = self.__dict__.setdefault("_prepared_params", {})
+        if key in cache:
+            return cache[key]
+        if len(cache) >= _PREPARED_PARAMS_MAXSIZE:
+            cache.clear()
+        prepared = cache[key] = self.prepare_params(params)
+        return prepared
+
     @abstractmethod
     def generate_signal(
         self,
@@ -48,7 +48,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Literal, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from loguru import logger
 
@@ -56,13 +56,16 @@ from .base import BaseStrategy, SignalType, TradingSignal
 from .registry import StrategyRegistry
 from ..models import MarketSnapshot, OrderBookContext, PositionContext
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # ---------- 内部数据结构 ----------
 
 Side = Literal["YES", "NO"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     """持仓组合（内部计算用）"""
 
@@ -122,18 +125,15 @@ def min_buy_qty_for_target_profit(
     if p >= settle:
         return None  # 买入价 >= 结算价，不划算
 
+    # 买入 side 的 x 份后：
+    # profit_own = own + x * (settle - p)
+    # profit_other = other - x * p
     if side_to_buy == "YES":
-        # 买 YES x 后：
-        # profit_YES = profit_yes + x * (settle - p)
-        # profit_NO = profit_no - x * p
-        lower = (target_profit - profit_yes) / (settle - p)
-        upper = (profit_no - target_profit) / p
+        own, other = profit_yes, profit_no
     else:
-        # 买 NO x 后：
-        # profit_NO = profit_no + x * (settle - p)
-        # profit_YES = profit_yes - x * p
-        lower = (target_profit - profit_no) / (settle - p)
-        upper = (profit_yes - target_profit) / p
+        own, other = profit_no, profit_yes
+    lower = (target_profit - own) / (settle - p)
+    upper = (other - target_profit) / p
 
     x_min = max(0.0, lower)
     if upper < x_min - 1e-12:
@@ -142,6 +142,84 @@ def min_buy_qty_for_target_profit(
     return x_min
 
 
+def batch_generate_signals(
+    q_yes: "np.ndarray",
+    q_no: "np.ndarray",
+    net_cost: "np.ndarray",
+    yes_ask: "np.ndarray",
+    no_ask: "np.ndarray",
+    target_profit: float = 0.0,
+) -> "np.ndarray":
+    """批量计算锁定利润信号（回测用）
+
+    与 LockedProfitStrategy.generate_signal 的判定逻辑一致（settle=1.0），
+    按 tick 逐元素向量化计算，避免回测时逐条构造 Portfolio / TradingSignal。
+    实盘仍走逐 tick 的 generate_signal。
+
+    Args:
+        q_yes: YES 份额
+        q_no: NO 份额
+        net_cost: 净成本（YES + NO 总成本）
+        yes_ask: YES 最优卖价，无报价用 NaN
+        no_ask: NO 最优卖价，无报价用 NaN
+        target_profit: 目标保底利润
+
+    Returns:
+        结构化数组，字段：
+        - buy: 是否产生买入信号
+        - buy_yes: 需要买入的边是否为 YES
+        - raw_ask: 买入边的价格
+        - min_qty: 最小买入量（不可行时为 NaN）
+        - profit_if_yes_wins / profit_if_no_wins: 当前两边利润
+    """
+    # numpy 由 pandas 引入，仅回测路径需要，按需导入
+    import numpy as np
+
+    q_yes = np.asarray(q_yes, dtype=np.float64)
+    q_no = np.asarray(q_no, dtype=np.float64)
+    net_cost = np.asarray(net_cost, dtype=np.float64)
+    yes_ask = np.asarray(yes_ask, dtype=np.float64)
+    no_ask = np.asarray(no_ask, dtype=np.float64)
+
+    profit_yes = q_yes - net_cost
+    profit_no = q_no - net_cost
+
+    buy_yes = profit_yes < profit_no
+    p = np.where(buy_yes, yes_ask, no_ask)
+    own = np.where(buy_yes, profit_yes, profit_no)
+    other = np.where(buy_yes, profit_no, profit_yes)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_min = np.clip((target_profit - own) / (1.0 - p), 0.0, None)
+        upper = (other - target_profit) / p
+
+    has_position = (q_yes > 0) | (q_no > 0)
+    reached = (profit_yes >= target_profit) & (profit_no >= target_profit)
+    feasible = ~np.isnan(p) & (p < 1.0) & (upper >= x_min - 1e-12)
+
+    candidate = has_position & ~reached & feasible
+    min_qty = np.where(candidate, x_min, np.nan)
+
+    result = np.empty(
+        q_yes.shape,
+        dtype=[
+            ("buy", np.bool_),
+            ("buy_yes", np.bool_),
+            ("raw_ask", np.float64),
+            ("min_qty", np.float64),
+            ("profit_if_yes_wins", np.float64),
+            ("profit_if_no_wins", np.float64),
+        ],
+    )
+    result["buy"] = candidate & (x_min >= 0.01)
+    result["buy_yes"] = buy_yes
+    result["raw_ask"] = p
+    result["min_qty"] = min_qty
+    result["profit_if_yes_wins"] = profit_yes
+    result["profit_if_no_wins"] = profit_no
+    return result
+
+
 # ---------- 策略实现 ----------
 
 
@@ -161,6 +239,14 @@ class LockedProfitStrategy(BaseStrategy):
         """获取参数，优先使用传入值，否则使用默认值"""
         return params.get(key, self.DEFAULT_PARAMS.get(key))
 
+    def prepare_params(self, params: dict[str, Any]) -> float:
+        """解析目标利润参数，非法值回退为 0"""
+        target = self._get_param(params, "target_profit")
+        try:
+            return float(target)
+        except (TypeError, ValueError):
+            return 0.0
+
     def generate_signal(
         self,
         snapshot: MarketSnapshot,
@@ -186,11 +272,7 @@ class LockedProfitStrategy(BaseStrategy):
         locked = port.locked_profit()
 
         # 4. 获取目标利润参数
-        target = self._get_param(params, "target_profit")
-        try:
-            target = float(target)
-        except (TypeError, ValueError):
-            target = 0.0
+        target: float = self.resolve_params(params)
 
         # 构建基础元数据
         base_metadata = {
@@ -229,30 +311,34 @@ class LockedProfitStrategy(BaseStrategy):
             )
 
         # 7. 计算达到目标利润的最小买入量
-        min_qty = min_buy_qty_for_target_profit(
-            port, side_to_buy, raw_ask, target
-        )
-
+        #    与 min_buy_qty_for_target_profit(settle=1.0) 等价，内联以复用上面已算出的利润
+        if side_to_buy == "YES":
+            own, other = profit_yes_wins, profit_no_wins
+        else:
+            own, other = profit_no_wins, profit_yes_wins
+        min_qty: Optional[float] = None
+        if raw_ask < 1.0:
+            x_min = max(0.0, (target - own) / (1.0 - raw_ask))
+            if (other - target) / raw_ask >= x_min - 1e-12:
+                min_qty = x_min
+
+        # 以下每条分支都直接返回，原地补充 base_metadata 即可，无需复制
         if min_qty is None:
+            base_metadata["side_to_buy"] = side_to_buy
+            base_metadata["raw_ask"] = raw_ask
             return TradingSignal(
                 signal_type=SignalType.HOLD,
                 reason=f"无法达到目标利润（{side_to_buy} ask={raw_ask:.4f} 过高或仓位不平衡）",
-                metadata={
-                    **base_metadata,
-                    "side_to_buy": side_to_buy,
-                    "raw_ask": raw_ask,
-                },
+                metadata=base_metadata,
             )
 
         if min_qty < 0.01:  # 忽略过小的买入量
+            base_metadata["side_to_buy"] = side_to_buy
+            base_metadata["min_qty"] = min_qty
             return TradingSignal(
                 signal_type=SignalType.HOLD,
                 reason=f"对冲量过小 ({min_qty:.4f})，已接近目标",
-                metadata={
-                    **base_metadata,
-                    "side_to_buy": side_to_buy,
-                    "min_qty": min_qty,
-                },
+                metadata=base_metadata,
             )
 
         # 8. 计算买入后的预期利润
@@ -267,11 +353,24 @@ class LockedProfitStrategy(BaseStrategy):
         new_locked = min(new_profit_yes, new_profit_no)
 
         logger.info(
-            f"锁定利润信号: 买入 {side_to_buy} {min_qty:.2f} @ {raw_ask:.4f}, "
-            f"成本 ${cost:.2f}, 新锁定利润 ${new_locked:.2f}"
+            "锁定利润信号: 买入 {} {:.2f} @ {:.4f}, 成本 ${:.2f}, 新锁定利润 ${:.2f}",
+            side_to_buy,
+            min_qty,
+            raw_ask,
+            cost,
+            new_locked,
         )
 
         # 9. 生成买入信号
+        base_metadata.update(
+            side_to_buy=side_to_buy,
+            raw_ask=raw_ask,
+            min_qty=min_qty,
+            cost=cost,
+            new_profit_if_yes_wins=new_profit_yes,
+            new_profit_if_no_wins=new_profit_no,
+            new_locked_profit=new_locked,
+        )
         return TradingSignal(
             signal_type=SignalType.BUY,
             yes_size=min_qty if side_to_buy == "YES" else None,
@@ -279,14 +378,5 @@ class LockedProfitStrategy(BaseStrategy):
             yes_price=raw_ask if side_to_buy == "YES" else None,
             no_price=raw_ask if side_to_buy == "NO" else None,
             reason=f"对冲买入 {side_to_buy} {min_qty:.2f} @ {raw_ask:.4f}，锁定利润 ${locked:.2f} → ${new_locked:.2f}",
-            metadata={
-                **base_metadata,
-                "side_to_buy": side_to_buy,
-                "raw_ask": raw_ask,
-                "min_qty": min_qty,
-                "cost": cost,
-                "new_profit_if_yes_wins": new_profit_yes,
-                "new_profit_if_no_wins": new_profit_no,
-                "new_locked_profit": new_locked,
-            },
+            metadata=base_metadata,
         )
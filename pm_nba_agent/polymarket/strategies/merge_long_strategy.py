@@ -45,7 +45,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from loguru import logger
 
@@ -53,6 +53,9 @@ from .base import BaseStrategy, TradingSignal, SignalType
 from .registry import StrategyRegistry
 from ..models import MarketSnapshot, OrderBookContext, PositionContext
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @StrategyRegistry.register("merge_long")
 class MergeLongStrategy(BaseStrategy):
@@ -71,6 +74,63 @@ class MergeLongStrategy(BaseStrategy):
         """获取参数，优先使用传入值，否则使用默认值"""
         return params.get(key, self.DEFAULT_PARAMS.get(key))
 
+    def prepare_params(self, params: dict[str, Any]) -> tuple[float, Any]:
+        """解析参数为 (min_arbitrage_gap, total_budget)
+
+        total_budget 保留原值，由 generate_signal 校验并给出 HOLD 原因。
+        """
+        min_arbitrage_gap = self._get_param(params, "min_arbitrage_gap")
+        try:
+            min_arbitrage_gap = float(min_arbitrage_gap)
+        except (TypeError, ValueError):
+            min_arbitrage_gap = 0.0
+        return min_arbitrage_gap, self._get_param(params, "total_budget")
+
+    @staticmethod
+    def scan_batch(
+        yes_ask: "np.ndarray",
+        no_ask: "np.ndarray",
+        yes_bid: "np.ndarray",
+        no_bid: "np.ndarray",
+        min_arbitrage_gap: float,
+        total_budget: float,
+    ) -> tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+        """批量扫描多个市场的合并套利机会
+
+        与 generate_signal 的触发条件一致，逐元素向量化计算，适合全市场扫描；
+        单市场调用仍使用 generate_signal。缺失的 bid/ask 用 NaN 表示，对应行不会触发。
+
+        Args:
+            yes_ask / no_ask / yes_bid / no_bid: 各市场最优价格
+            min_arbitrage_gap: 最小套利空间
+            total_budget: 单次交易总预算
+
+        Returns:
+            (触发掩码, 买入数量, 做多成本, 有效买入价 YES, 有效买入价 NO)；
+            未触发行的买入数量为 NaN
+        """
+        # numpy 由 pandas 引入，仅批量扫描需要，按需导入
+        import numpy as np
+
+        yes_ask = np.asarray(yes_ask, dtype=np.float64)
+        no_ask = np.asarray(no_ask, dtype=np.float64)
+        yes_bid = np.asarray(yes_bid, dtype=np.float64)
+        no_bid = np.asarray(no_bid, dtype=np.float64)
+
+        effective_buy_yes = np.minimum(yes_ask, 1.0 - no_bid)
+        effective_buy_no = np.minimum(no_ask, 1.0 - yes_bid)
+        long_cost = effective_buy_yes + effective_buy_no
+
+        threshold = 1.0 - min_arbitrage_gap
+        triggered = (long_cost <= threshold + 1e-6) & (long_cost > 0)
+        if total_budget <= 0:
+            triggered[:] = False
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sizes = np.where(triggered, total_budget / long_cost, np.nan)
+
+        return triggered, sizes, long_cost, effective_buy_yes, effective_buy_no
+
     def generate_signal(
         self,
         snapshot: MarketSnapshot,
@@ -94,12 +154,15 @@ class MergeLongStrategy(BaseStrategy):
             )
 
         # 计算有效买入价格
-        effective_buy_yes = min(yes_ask, 1.0 - no_bid)
-        effective_buy_no = min(no_ask, 1.0 - yes_bid)
+        # 标量比较代替内置 min()，省去通用调用开销
+        inv_no_bid = 1.0 - no_bid
+        inv_yes_bid = 1.0 - yes_bid
+        effective_buy_yes = yes_ask if yes_ask < inv_no_bid else inv_no_bid
+        effective_buy_no = no_ask if no_ask < inv_yes_bid else inv_yes_bid
         long_cost = effective_buy_yes + effective_buy_no
 
         logger.debug(
-            "YES ask=%.4f bid=%.4f, NO ask=%.4f bid=%.4f, cost=%.4f",
+            "YES ask={:.4f} bid={:.4f}, NO ask={:.4f} bid={:.4f}, cost={:.4f}",
             yes_ask,
             yes_bid,
             no_ask,
@@ -108,15 +171,9 @@ class MergeLongStrategy(BaseStrategy):
         )
 
         # 获取参数
-        min_arbitrage_gap = self._get_param(params, "min_arbitrage_gap")
-        total_budget = self._get_param(params, "total_budget")
+        min_arbitrage_gap, total_budget = self.resolve_params(params)
 
         # 参数验证
-        try:
-            min_arbitrage_gap = float(min_arbitrage_gap)
-        except (TypeError, ValueError):
-            min_arbitrage_gap = 0.0
-
         if not isinstance(total_budget, (int, float)) or total_budget <= 0:
             return TradingSignal(
                 signal_type=SignalType.HOLD,
@@ -170,10 +227,21 @@ class MergeLongStrategy(BaseStrategy):
         expected_profit_pct = (1.0 - long_cost) * 100
 
         logger.info(
-            f"套利触发: cost={long_cost:.4f}, threshold={threshold:.4f}, size={size:.2f}, "
-            f"profit={expected_profit:.2f} ({expected_profit_pct:.2f}%)"
+            "套利触发: cost={:.4f}, threshold={:.4f}, size={:.2f}, profit={:.2f} ({:.2f}%)",
+            long_cost,
+            threshold,
+            size,
+            expected_profit,
+            expected_profit_pct,
         )
 
+        # BUY 分支直接返回，原地补充 base_metadata 即可，无需复制
+        base_metadata.update(
+            total_budget=total_budget,
+            size=size,
+            expected_profit=expected_profit,
+            expected_profit_pct=expected_profit_pct,
+        )
         return TradingSignal(
             signal_type=SignalType.BUY,
             yes_size=size,
@@ -181,11 +249,5 @@ class MergeLongStrategy(BaseStrategy):
             yes_price=effective_buy_yes,
             no_price=effective_buy_no,
             reason=f"套利: 成本 {long_cost:.2f} <= 阈值 {threshold:.2f}，预期利润 {expected_profit_pct:.2f}%",
-            metadata={
-                **base_metadata,
-                "total_budget": total_budget,
-                "size": size,
-                "expected_profit": expected_profit,
-                "expected_profit_pct": expected_profit_pct,
-            },
+            metadata=base_metadata,
         )
@@ -59,6 +59,8 @@ class StrategyRegistry:
                     strategy_cls.__name__,
                 )
             cls._strategies[strategy_id] = strategy_cls
+            # 覆盖注册时丢弃旧类的缓存实例
+            cls._instances.pop(strategy_id, None)
             logger.debug("已注册策略: {} -> {}", strategy_id, strategy_cls.__name__)
             return strategy_cls
 
@@ -74,9 +76,14 @@ class StrategyRegistry:
         Returns:
             策略实例；未找到时返回 None
         """
-        if strategy_id in cls._instances:
-            return cls._instances[strategy_id]
+        instance = cls._instances.get(strategy_id)
+        if instance is not None:
+            return instance
+        return cls._create(strategy_id)
 
+    @classmethod
+    def _create(cls, strategy_id: str) -> Optional[BaseStrategy]:
+        """首次获取时实例化策略并缓存（冷路径）"""
         strategy_cls = cls._strategies.get(strategy_id)
         if strategy_cls is None:
             logger.error("策略未注册: {}", strategy_id)
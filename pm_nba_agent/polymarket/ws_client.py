@@ -5,6 +5,8 @@ from __future__ import annotations
 import asyncio
 import inspect
 import json
+import sys
+from collections import deque
 from loguru import logger
 import threading
 from importlib import import_module
@@ -28,6 +30,8 @@ class PolymarketWebSocketClient:
     RECONNECT_BASE_DELAY = 1
     RECONNECT_MAX_DELAY = 30
     MAX_RECONNECT_ATTEMPTS = None
+    # 心跳帧预编码为 bytes，websocket-client 以文本帧原样发送
+    _PING_FRAME = b"PING"
 
     def __init__(
         self,
@@ -59,19 +63,33 @@ class PolymarketWebSocketClient:
         self.ws: Optional[WebSocketApp] = None
         self.is_connected = False
         self._subscribed_assets: list[str] = []
+        # 与 _subscribed_assets 同步维护，用于 O(1) 去重与成员判断
+        self._subscribed_set: set[str] = set()
+        # 初始订阅帧缓存，订阅列表变化时置空
+        self._subscribe_frame: Optional[str] = None
         self._subscribe_type = self.SUBSCRIBE_TYPE_BOOK
         self._heartbeat_thread: Optional[threading.Thread] = None
         self._stop_heartbeat = threading.Event()
         self._ws_thread: Optional[threading.Thread] = None
         self._connection_ready = threading.Event()
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        # WS 线程 -> 事件循环的消息队列；积压期间只唤醒一次事件循环，按序批量处理
+        self._pending_messages: deque[Any] = deque()
+        self._drain_lock = threading.Lock()
+        self._drain_scheduled = False
+        self._drain_task: Optional[asyncio.Task] = None
         self._has_initialized_subscription = False
         self._stop_reconnect = threading.Event()
         self._reconnect_attempts = 0
 
     async def connect(self) -> bool:
         try:
-            self._event_loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
+            if loop is not self._event_loop:
+                # 旧事件循环上的积压消息与批处理状态不再有效
+                self._reset_pending_messages()
+            self._event_loop = loop
+            logger.debug("WebSocket 回调事件循环: {}", type(self._event_loop).__module__)
             self.ws = self._create_ws_app()
 
             logger.info("正在连接 Polymarket WebSocket: {}", self.wss_url)
@@ -175,16 +193,19 @@ class PolymarketWebSocketClient:
                 logger.debug("market channel 忽略 markets 参数")
 
             self._subscribe_type = subscribe_type
+            # Token ID 为长字符串，驻留后集合/字典查找可走身份比较快路径
+            asset_ids = [sys.intern(asset) for asset in asset_ids]
 
-            merged_assets = self._subscribed_assets + asset_ids
-            self._subscribed_assets = list(dict.fromkeys(merged_assets))
+            subscribed = self._subscribed_set
+            for asset in asset_ids:
+                if asset not in subscribed:
+                    subscribed.add(asset)
+                    self._subscribed_assets.append(asset)
+            self._subscribe_frame = None
 
             if self.is_connected and self.ws:
                 if not self._has_initialized_subscription:
-                    subscribe_msg = {
-                        "type": self.MARKET_CHANNEL.upper(),
-                        "assets_ids": self._subscribed_assets,
-                    }
+                    payload = self._get_initial_subscribe_frame()
 
                     self._has_initialized_subscription = True
                     logger.info(
@@ -193,10 +214,10 @@ class PolymarketWebSocketClient:
                         subscribe_type,
                     )
                 else:
-                    subscribe_msg = {
+                    payload = json.dumps({
                         "operation": "subscribe",
                         "assets_ids": asset_ids,
-                    }
+                    })
 
                     logger.info(
                         "已订阅 {} 个 Token (类型: {})",
@@ -204,8 +225,8 @@ class PolymarketWebSocketClient:
                         subscribe_type,
                     )
 
-                logger.debug("订阅消息: {}", json.dumps(subscribe_msg))
-                self.ws.send(json.dumps(subscribe_msg))
+                logger.debug("订阅消息: {}", payload)
+                self.ws.send(payload)
             else:
                 logger.info(
                     "已添加 {} 个 Token 到订阅列表，连接时将自动订阅 (类型: {})",
@@ -245,11 +266,15 @@ class PolymarketWebSocketClient:
             self.ws.send(json.dumps(unsubscribe_msg))
 
             if asset_ids:
+                removed = {sys.intern(asset) for asset in asset_ids}
+                self._subscribed_set -= removed
                 self._subscribed_assets = [
-                    asset for asset in self._subscribed_assets if asset not in asset_ids
+                    asset for asset in self._subscribed_assets if asset not in removed
                 ]
             else:
                 self._subscribed_assets = []
+                self._subscribed_set.clear()
+            self._subscribe_frame = None
 
             logger.info("已取消订阅: {}", asset_ids or "all")
             return True
@@ -279,6 +304,8 @@ class PolymarketWebSocketClient:
 
         self.ws = None
         self._subscribed_assets = []
+        self._subscribed_set.clear()
+        self._subscribe_frame = None
         self._has_initialized_subscription = False
 
         if self.on_close_callback:
@@ -302,12 +329,7 @@ class PolymarketWebSocketClient:
                 return
 
             if self._subscribed_assets:
-                subscribe_msg = {
-                    "type": self.MARKET_CHANNEL.upper(),
-                    "assets_ids": self._subscribed_assets,
-                }
-
-                ws.send(json.dumps(subscribe_msg))
+                ws.send(self._get_initial_subscribe_frame())
                 self._has_initialized_subscription = True
                 logger.info(
                     "已发送初始订阅: {} 个 Token (类型: {})",
@@ -329,36 +351,60 @@ class PolymarketWebSocketClient:
             if self.on_error_callback:
                 self.on_error_callback(exc)
 
+    def _get_initial_subscribe_frame(self) -> str:
+        """获取初始订阅帧（按当前订阅列表序列化一次，重连时直接复用）"""
+        frame = self._subscribe_frame
+        if frame is None:
+            frame = json.dumps({
+                "type": self.MARKET_CHANNEL.upper(),
+                "assets_ids": self._subscribed_assets,
+            })
+            self._subscribe_frame = frame
+        return frame
+
     def _on_message(self, _ws: WebSocketApp, message: Any) -> None:
         try:
-            if isinstance(message, (bytes, bytearray)):
-                message = message.decode("utf-8", errors="ignore")
+            # 心跳回包无需解析，也不转发给下游
+            if message == "PONG" or message == b"PONG":
+                return
 
-            if not isinstance(message, str):
+            # json.loads 可直接解析 bytes（自动识别 UTF-8），二进制帧无需先 decode 成 str
+            if isinstance(message, (bytes, bytearray)):
+                json_prefixes: tuple[Any, ...] = (b"{", b"[")
+            elif isinstance(message, str):
+                json_prefixes = ("{", "[")
+            else:
                 logger.debug("忽略非文本消息: {}", type(message))
                 return
 
-            cleaned = message.strip()
+            # 绝大多数帧首尾没有空白，仅在需要时 strip，避免整帧复制
+            cleaned = message
+            if cleaned[:1].isspace() or cleaned[-1:].isspace():
+                cleaned = cleaned.strip()
+            is_json = cleaned[:1] in json_prefixes
+
             if not cleaned:
                 logger.debug("忽略空消息")
                 return
 
-            if not (cleaned.startswith("{") or cleaned.startswith("[")):
-                data = {"raw": cleaned}
-            else:
+            data: Any
+            if is_json:
                 try:
-                    data = json.loads(message)
-                except json.JSONDecodeError:
-                    data = {"raw": cleaned}
+                    data = json.loads(cleaned)
+                except ValueError as exc:
+                    # 以 { / [ 开头却解析失败的帧极少见，直接丢弃
+                    logger.debug("忽略无法解析的 JSON 消息: {}", exc)
+                    return
+            else:
+                if isinstance(cleaned, (bytes, bytearray)):
+                    cleaned = cleaned.decode("utf-8", errors="ignore")
+                data = {"raw": cleaned}
 
             if self.on_message_callback:
                 try:
                     if inspect.iscoroutinefunction(self.on_message_callback):
                         if self._event_loop and self._event_loop.is_running():
-                            asyncio.run_coroutine_threadsafe(
-                                self.on_message_callback(data),
-                                self._event_loop,
-                            )
+                            self._enqueue_message(self._event_loop, data)
                         else:
                             logger.warning("事件循环不可用，无法调用异步回调")
                     else:
@@ -369,6 +415,53 @@ class PolymarketWebSocketClient:
         except Exception as exc:
             logger.error("处理消息时出错: {}", exc)
 
+    def _enqueue_message(self, loop: asyncio.AbstractEventLoop, data: Any) -> None:
+        """在 WS 线程中入队消息，仅在没有待处理批次时唤醒事件循环"""
+        self._pending_messages.append(data)
+        with self._drain_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        loop.call_soon_threadsafe(self._schedule_drain)
+
+    def _schedule_drain(self) -> None:
+        # 保存任务引用，避免事件循环只持有弱引用导致任务在运行中被回收
+        self._drain_task = asyncio.ensure_future(self._drain_messages())
+
+    async def _drain_messages(self) -> None:
+        """在事件循环中按到达顺序依次调用异步回调，直到队列清空"""
+        pending = self._pending_messages
+        try:
+            while True:
+                while pending:
+                    data = pending.popleft()
+                    callback = self.on_message_callback
+                    if callback is None:
+                        continue
+                    try:
+                        await callback(data)
+                    except Exception as exc:
+                        logger.error("消息回调处理失败: {}", exc)
+
+                with self._drain_lock:
+                    if not pending:
+                        self._drain_scheduled = False
+                        self._drain_task = None
+                        return
+        finally:
+            # 被取消或随事件循环关闭退出时复位标记，否则后续消息不再触发批处理
+            if self._drain_task is asyncio.current_task():
+                with self._drain_lock:
+                    self._drain_scheduled = False
+                    self._drain_task = None
+
+    def _reset_pending_messages(self) -> None:
+        """清空待处理消息并复位批处理状态"""
+        with self._drain_lock:
+            self._pending_messages.clear()
+            self._drain_scheduled = False
+            self._drain_task = None
+
     def _on_error(self, _ws: WebSocketApp, error: Exception) -> None:
         logger.error("WebSocket 错误: {}", error)
         if self.on_error_callback:
@@ -405,7 +498,7 @@ class PolymarketWebSocketClient:
 
         while not self._stop_heartbeat.is_set() and self.is_connected:
             try:
-                ws.send("PING")
+                ws.send(self._PING_FRAME)
                 logger.debug("心跳发送成功")
             except Exception as exc:
                 logger.error("心跳发送失败: {}", exc)
@@ -417,7 +510,7 @@ class PolymarketWebSocketClient:
         return self._subscribed_assets.copy()
 
     def is_subscribed(self, token_id: str) -> bool:
-        return token_id in self._subscribed_assets
+        return token_id in self._subscribed_set
 
     def _apply_unsubscribe_locally(
         self,
@@ -427,8 +520,12 @@ class PolymarketWebSocketClient:
         if self.channel != self.MARKET_CHANNEL:
             return
         if asset_ids:
+            removed = {sys.intern(asset) for asset in asset_ids}
+            self._subscribed_set -= removed
             self._subscribed_assets = [
-                asset for asset in self._subscribed_assets if asset not in asset_ids
+                asset for asset in self._subscribed_assets if asset not in removed
             ]
         else:
             self._subscribed_assets = []
+            self._subscribed_set.clear()
+        self._subscribe_frame = None
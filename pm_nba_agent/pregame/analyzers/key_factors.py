@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+
 from ..models.analysis import Factor, KeyFactors, MatchupAnalysis, StrengthComparison
 from ..models.team_data import TeamPregameData
 
@@ -19,8 +21,9 @@ class KeyFactorsAnalyzer:
         """识别关键因素并生成摘要。"""
         factors: list[Factor] = []
 
-        home_home_pct = home.home_away_splits.home_win_pct
-        home_away_pct = home.home_away_splits.away_win_pct
+        splits = home.home_away_splits
+        home_home_pct = splits.home_win_pct
+        home_away_pct = splits.away_win_pct
         if home_home_pct - home_away_pct >= 0.1:
             factors.append(Factor(
                 name="Home Court Strength",
@@ -30,17 +33,19 @@ class KeyFactorsAnalyzer:
             ))
 
         momentum_gap = home.recent_form.momentum - away.recent_form.momentum
-        if abs(momentum_gap) >= 12:
+        abs_momentum_gap = abs(momentum_gap)
+        if abs_momentum_gap >= 12:
             favors = "Home" if momentum_gap > 0 else "Away"
             factors.append(Factor(
                 name="Momentum Gap",
                 impact="Medium",
-                description=f"近期势头差距 {abs(momentum_gap):.0f} 分",
+                description=f"近期势头差距 {abs_momentum_gap:.0f} 分",
                 favors=favors,
             ))
 
-        if matchup.head_to_head and matchup.head_to_head.get("season_record"):
-            record = matchup.head_to_head.get("season_record", "0-0")
+        h2h = matchup.head_to_head
+        record = h2h.season_record if h2h else None
+        if record:
             if record not in {"0-0", "1-1"}:
                 factors.append(Factor(
                     name="Season Series",
@@ -49,24 +54,26 @@ class KeyFactorsAnalyzer:
                     favors=None,
                 ))
 
-        if abs(comparison.overall_diff) >= 8:
-            favors = "Home" if comparison.overall_diff > 0 else "Away"
+        overall_diff = comparison.overall_diff
+        if abs(overall_diff) >= 8:
+            favors = "Home" if overall_diff > 0 else "Away"
             factors.append(Factor(
                 name="Overall Rating Gap",
                 impact="High",
-                description=f"综合评分差距 {abs(comparison.overall_diff):.1f}",
+                description=f"综合评分差距 {abs(overall_diff):.1f}",
                 favors=favors,
             ))
 
-        if matchup.style_matchup.pace_advantage:
+        pace_advantage = matchup.style_matchup.pace_advantage
+        if pace_advantage:
             factors.append(Factor(
                 name="Pace Advantage",
                 impact="Low",
-                description=f"节奏优势在 {matchup.style_matchup.pace_advantage} 方",
-                favors=matchup.style_matchup.pace_advantage,
+                description=f"节奏优势在 {pace_advantage} 方",
+                favors=pace_advantage,
             ))
 
-        factors.sort(key=lambda item: self._impact_score(item.impact), reverse=True)
+        factors.sort(key=attrgetter("impact_score"), reverse=True)
         summary = self._build_summary(factors)
 
         return KeyFactors(
@@ -74,9 +81,6 @@ class KeyFactorsAnalyzer:
             summary=summary,
         )
 
-    def _impact_score(self, impact: str) -> int:
-        return {"High": 3, "Medium": 2, "Low": 1}.get(impact, 0)
-
     def _build_summary(self, factors: list[Factor]) -> str:
         if not factors:
             return "关键因素暂无显著差异"
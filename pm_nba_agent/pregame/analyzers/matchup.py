@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ..collectors.matchup import HeadToHeadRecord
 from ..models.analysis import MatchupAnalysis, StyleMatchup
 from ..models.team_data import TeamPregameData
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# analyze_many 中优势方的整数编码
+_ADVANTAGE_LABELS = {1: "Home", -1: "Away", 0: None}
+
 
 class MatchupAnalyzer:
     """生成对阵风格与历史概览。"""
@@ -17,10 +26,9 @@ class MatchupAnalyzer:
         h2h: HeadToHeadRecord | None,
     ) -> MatchupAnalysis:
         """综合对阵分析。"""
-        head_to_head = h2h.to_dict() if h2h else {}
         style_matchup = self._analyze_style_matchup(home_team, away_team)
         return MatchupAnalysis(
-            head_to_head=head_to_head,
+            head_to_head=h2h,
             style_matchup=style_matchup,
         )
 
@@ -30,13 +38,16 @@ class MatchupAnalyzer:
         away: TeamPregameData,
     ) -> StyleMatchup:
         """对节奏、三分和防守效率做快速对比。"""
-        pace_diff = home.season_stats.pace - away.season_stats.pace
+        home_stats = home.season_stats
+        away_stats = away.season_stats
+
+        pace_diff = home_stats.pace - away_stats.pace
         pace_advantage = self._advantage_by_threshold(pace_diff, 2.0)
 
-        fg3_diff = home.season_stats.fg3_pct - away.season_stats.fg3_pct
+        fg3_diff = home_stats.fg3_pct - away_stats.fg3_pct
         three_point_advantage = self._advantage_by_threshold(fg3_diff, 0.02)
 
-        def_rating_diff = home.season_stats.def_rating - away.season_stats.def_rating
+        def_rating_diff = home_stats.def_rating - away_stats.def_rating
         defense_advantage = self._defense_advantage(def_rating_diff)
 
         return StyleMatchup(
@@ -48,13 +59,78 @@ class MatchupAnalyzer:
             def_rating_diff=def_rating_diff,
         )
 
-    def _advantage_by_threshold(self, diff: float, threshold: float) -> str | None:
+    def analyze_many(self, teams: list[TeamPregameData]) -> "np.ndarray":
+        """批量计算所有 (主队, 客队) 组合的风格对比（全联盟/整晚扫描用）
+
+        Args:
+            teams: 球队列表
+
+        Returns:
+            形状为 (n, n) 的结构化数组，[i, j] 表示 teams[i] 主场对 teams[j]；
+            优势方编码为 1=Home、-1=Away、0=无，可用 style_matchup_at 还原单场结果
+        """
+        # numpy 由 pandas 引入，仅批量扫描需要，按需导入
+        import numpy as np
+
+        stats = [team.season_stats for team in teams]
+        pace = np.fromiter((s.pace for s in stats), dtype=np.float64, count=len(stats))
+        fg3_pct = np.fromiter((s.fg3_pct for s in stats), dtype=np.float64, count=len(stats))
+        def_rating = np.fromiter(
+            (s.def_rating for s in stats), dtype=np.float64, count=len(stats)
+        )
+
+        pace_diff = np.subtract.outer(pace, pace)
+        fg3_diff = np.subtract.outer(fg3_pct, fg3_pct)
+        def_rating_diff = np.subtract.outer(def_rating, def_rating)
+
+        result = np.empty(
+            pace_diff.shape,
+            dtype=[
+                ("pace_diff", np.float64),
+                ("pace_advantage", np.int8),
+                ("fg3_pct_diff", np.float64),
+                ("three_point_advantage", np.int8),
+                ("def_rating_diff", np.float64),
+                ("defense_advantage", np.int8),
+            ],
+        )
+        result["pace_diff"] = pace_diff
+        result["pace_advantage"] = np.where(
+            np.abs(pace_diff) < 2.0, 0, np.sign(pace_diff)
+        )
+        result["fg3_pct_diff"] = fg3_diff
+        result["three_point_advantage"] = np.where(
+            np.abs(fg3_diff) < 0.02, 0, np.sign(fg3_diff)
+        )
+        result["def_rating_diff"] = def_rating_diff
+        # 防守效率越低越好，符号取反
+        result["defense_advantage"] = np.where(
+            np.abs(def_rating_diff) < 2.0, 0, -np.sign(def_rating_diff)
+        )
+        return result
+
+    @staticmethod
+    def style_matchup_at(batch: "np.ndarray", home_index: int, away_index: int) -> StyleMatchup:
+        """从 analyze_many 的结果中取出单场 StyleMatchup"""
+        row = batch[home_index, away_index]
+        return StyleMatchup(
+            pace_advantage=_ADVANTAGE_LABELS[int(row["pace_advantage"])],
+            pace_diff=float(row["pace_diff"]),
+            three_point_advantage=_ADVANTAGE_LABELS[int(row["three_point_advantage"])],
+            fg3_pct_diff=float(row["fg3_pct_diff"]),
+            defense_advantage=_ADVANTAGE_LABELS[int(row["defense_advantage"])],
+            def_rating_diff=float(row["def_rating_diff"]),
+        )
+
+    @staticmethod
+    def _advantage_by_threshold(diff: float, threshold: float) -> str | None:
         """按阈值判断优势方。"""
         if abs(diff) < threshold:
             return None
         return "Home" if diff > 0 else "Away"
 
-    def _defense_advantage(self, diff: float) -> str | None:
+    @staticmethod
+    def _defense_advantage(diff: float) -> str | None:
         """防守效率越低越好。"""
         if abs(diff) < 2.0:
             return None
@@ -2,25 +2,74 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable
+
 from ..models.analysis import ComparisonItem, StrengthComparison
 from ..models.team_data import TeamPregameData, TeamStatistics
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# 分项对比表：(指标名称, 取值函数, 优势阈值, 方向)；方向 -1 表示数值越低越好（防守效率）
+_METRICS: tuple[tuple[str, attrgetter, float, int], ...] = (
+    ("Offense Rating", attrgetter("off_rating"), 1.0, 1),
+    ("Defense Rating", attrgetter("def_rating"), 2.0, -1),
+    ("Net Rating", attrgetter("net_rating"), 1.0, 1),
+    ("Rebounds", attrgetter("rpg"), 1.5, 1),
+    ("3PT%", attrgetter("fg3_pct"), 0.02, 1),
+)
+
+# 综合评分：50 + Σ 系数 × (指标 - 基准)；防守效率以负系数表示越低越好
+_OVERALL_TERMS: tuple[tuple[str, float, float], ...] = (
+    ("net_rating", 2.0, 0.0),
+    ("off_rating", 0.5, 110.0),
+    ("def_rating", -0.5, 110.0),
+    ("fg3_pct", 50.0, 0.35),
+    ("rpg", 0.3, 44.0),
+)
+
 
 class StrengthComparator:
     """对比两队整体与分项实力。"""
 
     def compare(self, home: TeamPregameData, away: TeamPregameData) -> StrengthComparison:
         """生成实力对比结果。"""
-        comparisons = [
-            self._compare_metric("Offense Rating", home.season_stats.off_rating, away.season_stats.off_rating),
-            self._compare_defense("Defense Rating", home.season_stats.def_rating, away.season_stats.def_rating),
-            self._compare_metric("Net Rating", home.season_stats.net_rating, away.season_stats.net_rating),
-            self._compare_metric("Rebounds", home.season_stats.rpg, away.season_stats.rpg, threshold=1.5),
-            self._compare_metric("3PT%", home.season_stats.fg3_pct, away.season_stats.fg3_pct, threshold=0.02),
-        ]
-
-        home_overall = self._overall_score(home.season_stats)
-        away_overall = self._overall_score(away.season_stats)
+        home_stats = home.season_stats
+        away_stats = away.season_stats
+
+        # 赛季初联盟统计可能全为 0，此时对比没有意义，直接返回中性结果
+        if home_stats.off_rating == 0 and away_stats.off_rating == 0:
+            return StrengthComparison(
+                home_overall=50.0,
+                away_overall=50.0,
+                overall_advantage=None,
+                overall_diff=0.0,
+                comparisons=[],
+            )
+
+        comparisons = []
+        for metric, getter, threshold, direction in _METRICS:
+            home_value = getter(home_stats)
+            away_value = getter(away_stats)
+            diff = home_value - away_value
+            if abs(diff) < threshold:
+                advantage = None
+            else:
+                advantage = "Home" if diff * direction > 0 else "Away"
+            comparisons.append(
+                ComparisonItem(
+                    metric=metric,
+                    home_value=home_value,
+                    away_value=away_value,
+                    advantage=advantage,
+                    diff=diff,
+                )
+            )
+
+        home_overall = self._overall_score(home_stats)
+        away_overall = self._overall_score(away_stats)
         overall_diff = home_overall - away_overall
 
         if abs(overall_diff) < 5:
@@ -36,48 +85,29 @@ class StrengthComparator:
             comparisons=comparisons,
         )
 
-    def _overall_score(self, stats: TeamStatistics) -> float:
+    @staticmethod
+    def _overall_score(stats: TeamStatistics) -> float:
         """计算综合评分（0-100）。"""
         score = 50.0
-        score += stats.net_rating * 2.0
-        score += (stats.off_rating - 110.0) * 0.5
-        score += (110.0 - stats.def_rating) * 0.5
-        score += (stats.fg3_pct - 0.35) * 50.0
-        score += (stats.rpg - 44.0) * 0.3
+        for attr, coeff, baseline in _OVERALL_TERMS:
+            score += (getattr(stats, attr) - baseline) * coeff
         return max(0.0, min(100.0, score))
 
-    def _compare_metric(
-        self,
-        metric: str,
-        home_value: float,
-        away_value: float,
-        threshold: float = 1.0,
-    ) -> ComparisonItem:
-        """通用正向指标对比。"""
-        diff = home_value - away_value
-        if abs(diff) < threshold:
-            advantage = None
-        else:
-            advantage = "Home" if diff > 0 else "Away"
-        return ComparisonItem(
-            metric=metric,
-            home_value=home_value,
-            away_value=away_value,
-            advantage=advantage,
-            diff=diff,
-        )
+    @staticmethod
+    def overall_scores(stats_list: Iterable[TeamStatistics]) -> "np.ndarray":
+        """批量计算多支球队的综合评分，一次矩阵乘法完成。
 
-    def _compare_defense(self, metric: str, home_value: float, away_value: float) -> ComparisonItem:
-        """防守效率数值越低越好。"""
-        diff = home_value - away_value
-        if abs(diff) < 2.0:
-            advantage = None
-        else:
-            advantage = "Home" if diff < 0 else "Away"
-        return ComparisonItem(
-            metric=metric,
-            home_value=home_value,
-            away_value=away_value,
-            advantage=advantage,
-            diff=diff,
-        )
+        与 _overall_score 公式一致，适合全联盟预计算；单场对比仍走标量路径。
+        """
+        # numpy 由 pandas 引入，仅批量计算需要，按需导入
+        import numpy as np
+
+        attrs = [term[0] for term in _OVERALL_TERMS]
+        coeffs = np.array([term[1] for term in _OVERALL_TERMS])
+        baselines = np.array([term[2] for term in _OVERALL_TERMS])
+
+        values = np.array(
+            [[getattr(stats, attr) for attr in attrs] for stats in stats_list],
+            dtype=np.float64,
+        ).reshape(-1, len(attrs))
+        return np.clip(50.0 + (values - baselines) @ coeffs, 0.0, 100.0)
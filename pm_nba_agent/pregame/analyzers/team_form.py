@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Optional
 
 from ..models.team_data import GameSummary, RecentForm
 
@@ -25,33 +25,51 @@ class TeamFormAnalyzer:
                 momentum=50.0,
             )
 
-        wins = sum(1 for g in games_list if g.result == "W")
-        losses = len(games_list) - wins
-        total_points = sum(g.points for g in games_list)
-        total_opp = sum(g.opp_points for g in games_list)
-        avg_points = total_points / len(games_list)
-        avg_opp = total_opp / len(games_list)
-        avg_margin = (total_points - total_opp) / len(games_list)
+        # 单次遍历同时累计胜场、得失分与最近 5 场胜场
+        n = len(games_list)
+        wins = total_points = total_opp = last5_wins = 0
+        for i, g in enumerate(games_list):
+            if g.result == "W":
+                wins += 1
+                if i < 5:
+                    last5_wins += 1
+            total_points += g.points
+            total_opp += g.opp_points
 
-        momentum = self._calculate_momentum(games_list, avg_margin)
+        losses = n - wins
+        avg_points = total_points / n
+        avg_opp = total_opp / n
+        avg_margin = (total_points - total_opp) / n
+
+        momentum = self._calculate_momentum(games_list, avg_margin, last5_wins)
 
         return RecentForm(
-            last_n_games=len(games_list),
+            last_n_games=n,
             wins=wins,
             losses=losses,
-            win_pct=wins / len(games_list),
+            win_pct=wins / n,
             avg_points=avg_points,
             avg_opp_points=avg_opp,
             avg_margin=avg_margin,
             momentum=momentum,
         )
 
-    def _calculate_momentum(self, games: list[GameSummary], avg_margin: float) -> float:
-        """计算势头评分（0-100）。"""
+    def _calculate_momentum(
+        self,
+        games: list[GameSummary],
+        avg_margin: float,
+        last5_wins: Optional[int] = None,
+    ) -> float:
+        """计算势头评分（0-100）。
+
+        last5_wins 为调用方已统计的最近 5 场胜场，提供时不再重复遍历。
+        """
         if not games:
             return 50.0
 
-        win_pct = sum(1 for g in games[:5] if g.result == "W") / min(5, len(games))
+        if last5_wins is None:
+            last5_wins = sum(1 for g in games[:5] if g.result == "W")
+        win_pct = last5_wins / min(5, len(games))
         win_component = (win_pct - 0.5) * 40
         margin_component = max(-10.0, min(10.0, avg_margin)) / 10.0 * 10.0
 
@@ -67,15 +85,13 @@ class TeamFormAnalyzer:
             return 0, 0
 
         first_result = games[0].result
-        streak_len = 0
-        for game in games:
-            if game.result == first_result:
-                streak_len += 1
-            else:
-                break
-
         if first_result == "W":
-            return 1, streak_len
-        if first_result == "L":
-            return -1, streak_len
-        return 0, 0
+            sign = 1
+        elif first_result == "L":
+            sign = -1
+        else:
+            return 0, 0
+
+        # 结果为单字符 W/L：拼成字符串后由 str.lstrip（C 实现）求首段连续长度
+        results = "".join([g.result or "-" for g in games])
+        return sign, len(results) - len(results.lstrip(first_result))
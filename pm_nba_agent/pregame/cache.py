@@ -1,14 +1,34 @@
-"""缓存管理器，提供内存和文件双层缓存。"""
+"""缓存管理器，提供内存和 SQLite 双层缓存。"""
 
-import json
-import os
+import pickle
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 
 
+class _Miss:
+    """负缓存标记：记录 "上游没有数据"，pickle 往返后仍是同一个单例。"""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "_MISS"
+
+    def __repr__(self) -> str:
+        return "<cache miss>"
+
+
+_MISS = _Miss()
+
+
 class CacheManager:
-    """双层缓存管理器（内存 + 文件）。
+    """双层缓存管理器（内存 + SQLite）。
+
+    持久层为缓存目录下的单个 SQLite 数据库（WAL 模式），值以 pickle 存储，
+    可直接保存 DataFrame 与 dataclass，避免每个键一个文件带来的大量文件系统操作。
 
     使用方法:
         cache = CacheManager(ttl=3600)
@@ -16,65 +36,119 @@ class CacheManager:
         data = cache.get('key')
     """
 
-    def __init__(self, cache_dir: str = ".cache", ttl: int = 3600):
+    DB_FILENAME = "cache.db"
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        ttl: int = 3600,
+        miss_ttl: int = 300,
+        max_entries: int = 256,
+    ):
         """初始化缓存管理器。
 
         Args:
             cache_dir: 缓存文件存储目录
             ttl: 缓存有效期（秒），默认3600秒（1小时）
+            miss_ttl: 负缓存（上游无数据）有效期（秒），默认300秒
+            max_entries: 内存缓存最大条目数，超出后按 LRU 淘汰（持久层不受影响）
         """
         self.cache_dir = Path(cache_dir)
         self.ttl = ttl
-        self._memory_cache: dict[str, tuple[Any, float]] = {}
+        self.miss_ttl = miss_ttl
+        self.max_entries = max_entries
+        # 内存层按最近使用排序，长时间运行时限制联盟统计 DataFrame 等大对象的常驻数量
+        self._memory_cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._memory_lock = threading.Lock()
 
         # 创建缓存目录
         self.cache_dir.mkdir(exist_ok=True)
 
+        # 收集器可能在线程池中并发访问，连接跨线程共享并由锁串行化
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.cache_dir / self.DB_FILENAME,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            "key TEXT PRIMARY KEY, timestamp REAL NOT NULL, data BLOB NOT NULL)"
+        )
+
     def get(self, key: str) -> Optional[Any]:
         """获取缓存数据。
 
-        先查内存缓存，再查文件缓存。
+        先查内存缓存，再查 SQLite。
 
         Args:
             key: 缓存键
 
         Returns:
-            缓存的数据，如果不存在或已过期则返回 None
+            缓存的数据，如果不存在、已过期或为负缓存则返回 None
+        """
+        return self.lookup(key)[1]
+
+    def lookup(self, key: str) -> tuple[bool, Any]:
+        """查询缓存，区分 "未命中" 与 "命中负缓存"。
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            (是否命中, 缓存数据)；命中负缓存时为 (True, None)
         """
         # 1. 检查内存缓存
-        if key in self._memory_cache:
-            data, timestamp = self._memory_cache[key]
-            if time.time() - timestamp < self.ttl:
-                return data
-            else:
+        with self._memory_lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                data, timestamp = entry
+                if time.time() - timestamp < self._ttl_for(data):
+                    self._memory_cache.move_to_end(key)
+                    return True, self._unwrap(data)
                 # 过期，删除
                 del self._memory_cache[key]
 
-        # 2. 检查文件缓存
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    timestamp = cache_data.get('timestamp', 0)
-                    if time.time() - timestamp < self.ttl:
-                        data = cache_data.get('data')
-                        # 加载到内存缓存
-                        self._memory_cache[key] = (data, timestamp)
-                        return data
-                    else:
-                        # 过期，删除文件
-                        cache_file.unlink()
-            except Exception:
-                # 文件损坏，删除
-                cache_file.unlink()
-
-        return None
+        # 2. 检查持久缓存
+        try:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT timestamp, data FROM kv WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return False, None
+
+        if row is None:
+            return False, None
+
+        timestamp, blob = row
+        age = time.time() - timestamp
+        if age >= self.ttl:
+            # 过期，删除
+            self._delete(key)
+            return False, None
+
+        try:
+            data = pickle.loads(blob)
+        except Exception:
+            # 数据损坏，删除
+            self._delete(key)
+            return False, None
+
+        if age >= self._ttl_for(data):
+            self._delete(key)
+            return False, None
+
+        # 加载到内存缓存
+        self._remember(key, data, timestamp)
+        return True, self._unwrap(data)
 
     def set(self, key: str, data: Any) -> None:
         """设置缓存数据。
 
-        同时写入内存和文件缓存。
+        同时写入内存和 SQLite。
 
         Args:
             key: 缓存键
@@ -83,28 +157,68 @@ class CacheManager:
         timestamp = time.time()
 
         # 1. 写入内存缓存
-        self._memory_cache[key] = (data, timestamp)
+        self._remember(key, data, timestamp)
 
-        # 2. 写入文件缓存
-        cache_file = self.cache_dir / f"{key}.json"
+        # 2. 写入持久缓存
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': timestamp,
-                    'data': data
-                }, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            # 文件写入失败不影响内存缓存
+            blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._db_lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO kv (key, timestamp, data) VALUES (?, ?, ?)",
+                    (key, timestamp, blob),
+                )
+        except Exception:
+            # 持久化失败不影响内存缓存
             pass
 
+    def set_miss(self, key: str) -> None:
+        """记录负缓存：上游暂无数据，在 miss_ttl 内不再重复请求。"""
+        self.set(key, _MISS)
+
     def clear(self) -> None:
-        """清空所有缓存（内存和文件）。"""
+        """清空所有缓存（内存和持久层）。"""
         # 清空内存缓存
-        self._memory_cache.clear()
-
-        # 清空文件缓存
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                cache_file.unlink()
-            except Exception:
-                pass
+        with self._memory_lock:
+            self._memory_cache.clear()
+
+        # 清空持久缓存
+        try:
+            with self._db_lock:
+                self._conn.execute("DELETE FROM kv")
+        except sqlite3.Error:
+            pass
+
+        # 清理旧版本遗留的单文件缓存
+        for pattern in ("*.pkl", "*.json"):
+            for cache_file in self.cache_dir.glob(pattern):
+                try:
+                    cache_file.unlink()
+                except Exception:
+                    pass
+
+    def close(self) -> None:
+        """关闭数据库连接。"""
+        with self._db_lock:
+            self._conn.close()
+
+    def _remember(self, key: str, data: Any, timestamp: float) -> None:
+        """写入内存层并淘汰最久未使用的条目。"""
+        with self._memory_lock:
+            self._memory_cache[key] = (data, timestamp)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.max_entries:
+                self._memory_cache.popitem(last=False)
+
+    def _ttl_for(self, data: Any) -> int:
+        return self.miss_ttl if data is _MISS else self.ttl
+
+    @staticmethod
+    def _unwrap(data: Any) -> Any:
+        return None if data is _MISS else data
+
+    def _delete(self, key: str) -> None:
+        try:
+            with self._db_lock:
+                self._conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+        except sqlite3.Error:
+            pass
@@ -1,6 +1,8 @@
 """数据收集器基类。"""
 
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import Any, Callable, Optional
 
 from loguru import logger
@@ -8,6 +10,13 @@ from loguru import logger
 from ..cache import CacheManager
 from ..rate_limiter import RateLimiter
 
+# 所有收集器默认共享同一个限流器，保证对 nba_api 的整体请求间隔
+_DEFAULT_RATE_LIMITER = RateLimiter(delay=0.6)
+
+# 进行中的请求（缓存键 -> Future）：多线程并发收集时同一键只请求一次，其余线程等待结果
+_INFLIGHT: dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 
 class BaseCollector(ABC):
     """所有数据收集器的基类。
@@ -15,14 +24,19 @@ class BaseCollector(ABC):
     封装缓存和限流逻辑，子类只需实现 collect 方法。
     """
 
-    def __init__(self, cache_manager: Optional[CacheManager] = None):
+    def __init__(
+        self,
+        cache_manager: Optional[CacheManager] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """初始化收集器。
 
         Args:
             cache_manager: 缓存管理器实例，如果不提供则不使用缓存
+            rate_limiter: 限流器实例，默认使用全局共享的限流器
         """
         self.cache = cache_manager
-        self.rate_limiter = RateLimiter(delay=0.6)
+        self.rate_limiter = rate_limiter or _DEFAULT_RATE_LIMITER
 
     @abstractmethod
     def collect(self, *args, **kwargs) -> Any:
@@ -55,14 +69,49 @@ class BaseCollector(ABC):
         Returns:
             获取到的数据，失败返回 None
         """
-        # 1. 检查缓存
+        # 1. 检查缓存（包括负缓存：近期确认无数据的键不再重复请求）
         if self.cache:
-            cached = self.cache.get(key)
-            if cached is not None:
+            hit, cached = self.cache.lookup(key)
+            if hit:
                 if verbose:
                     logger.info("使用缓存: {}", key)
                 return cached
 
+            # 同一键已有线程在请求时直接等待其结果
+            with _INFLIGHT_LOCK:
+                pending = _INFLIGHT.get(key)
+                is_leader = pending is None
+                if is_leader:
+                    pending = _INFLIGHT[key] = Future()
+            if not is_leader:
+                if verbose:
+                    logger.info("等待进行中的请求: {}", key)
+                return pending.result()
+
+            try:
+                # 上一个请求者可能刚写完缓存并退出，再确认一次
+                hit, data = self.cache.lookup(key)
+                if not hit:
+                    data = self._fetch_uncached(key, fetch_func, verbose)
+            except BaseException as e:
+                pending.set_exception(e)
+                raise
+            else:
+                pending.set_result(data)
+                return data
+            finally:
+                with _INFLIGHT_LOCK:
+                    _INFLIGHT.pop(key, None)
+
+        return self._fetch_uncached(key, fetch_func, verbose)
+
+    def _fetch_uncached(
+        self,
+        key: str,
+        fetch_func: Callable[[], Any],
+        verbose: bool = False
+    ) -> Any:
+        """限流后调用 API，并把结果（或负缓存）写入缓存。"""
         # 2. 限流
         self.rate_limiter.wait()
 
@@ -72,9 +121,12 @@ class BaseCollector(ABC):
                 logger.info("API 调用: {}", key)
             data = fetch_func()
 
-            # 4. 缓存结果
-            if self.cache and data is not None:
-                self.cache.set(key, data)
+            # 4. 缓存结果；无数据时写入短期负缓存
+            if self.cache:
+                if data is not None:
+                    self.cache.set(key, data)
+                else:
+                    self.cache.set_miss(key)
 
             return data
 
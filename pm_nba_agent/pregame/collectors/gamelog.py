@@ -1,5 +1,6 @@
 """比赛日志数据收集器。"""
 
+import re
 from typing import Optional
 
 from nba_api.stats.endpoints import teamgamelog
@@ -7,6 +8,9 @@ from nba_api.stats.endpoints import teamgamelog
 from ..models.team_data import GameSummary
 from .base import BaseCollector
 
+# MATCHUP 分隔符: "LAL vs. BOS"（主场）或 "LAL @ BOS"（客场）
+_MATCHUP_RE = re.compile(r' (?:vs\.|@) ')
+
 
 class GameLogCollector(BaseCollector):
     """收集球队比赛日志数据。"""
@@ -42,35 +46,44 @@ class GameLogCollector(BaseCollector):
             # 只取最近 N 场
             df = df.head(last_n)
 
-            games = []
-            for _, row in df.iterrows():
-                # 解析对手和主客场
-                matchup = str(row['MATCHUP'])
-                if ' vs. ' in matchup:
-                    is_home = True
-                    opponent = matchup.split(' vs. ')[1]
-                elif ' @ ' in matchup:
-                    is_home = False
-                    opponent = matchup.split(' @ ')[1]
-                else:
-                    is_home = True
-                    opponent = 'Unknown'
-
-                # 计算对手得分
-                points = int(row['PTS'])
-                plus_minus = int(row['PLUS_MINUS'])
-                opp_points = points - plus_minus
+            # 按列向量化解析，避免 iterrows 逐行构造 Series
+            matchup = df['MATCHUP'].astype(str)
+            is_away = (
+                ~matchup.str.contains(' vs. ', regex=False)
+                & matchup.str.contains(' @ ', regex=False)
+            )
+            opponents = (
+                matchup.str.split(_MATCHUP_RE, n=1)
+                .str[1]
+                .fillna('Unknown')
+            )
+            points = df['PTS'].astype(int)
+            plus_minus = df['PLUS_MINUS'].astype(int)
+            # 计算对手得分
+            opp_points = points - plus_minus
 
-                games.append(GameSummary(
-                    game_id=str(row['Game_ID']),
-                    date=str(row['GAME_DATE']),
+            games = [
+                GameSummary(
+                    game_id=game_id,
+                    date=date,
                     opponent=opponent,
-                    is_home=is_home,
-                    result=str(row['WL']),
-                    points=points,
-                    opp_points=opp_points,
-                    plus_minus=plus_minus
-                ))
+                    is_home=not away,
+                    result=result,
+                    points=pts,
+                    opp_points=opp_pts,
+                    plus_minus=pm,
+                )
+                for game_id, date, opponent, away, result, pts, opp_pts, pm in zip(
+                    df['Game_ID'].astype(str).tolist(),
+                    df['GAME_DATE'].astype(str).tolist(),
+                    opponents.tolist(),
+                    is_away.tolist(),
+                    df['WL'].astype(str).tolist(),
+                    points.tolist(),
+                    opp_points.tolist(),
+                    plus_minus.tolist(),
+                )
+            ]
 
             return games
 
@@ -1,7 +1,8 @@
 """对阵历史数据收集器（简化版）。"""
 
 from dataclasses import dataclass
-from typing import Optional, cast
+from functools import lru_cache
+from typing import Optional
 
 from loguru import logger
 
@@ -9,9 +10,16 @@ from nba_api.stats.endpoints import leaguegamefinder
 from nba_api.stats.static import teams
 
 from .base import BaseCollector
+from .gamelog import _MATCHUP_RE
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _team_abbr_map() -> dict[int, str]:
+    """球队 ID -> 缩写（nba_api 静态数据，进程内只构建一次）"""
+    return {t['id']: t['abbreviation'] for t in teams.get_teams()}
+
+
+@dataclass(slots=True)
 class HeadToHeadRecord:
     """对阵历史战绩（简化版）。"""
 
@@ -56,12 +64,7 @@ class MatchupHistoryCollector(BaseCollector):
         def fetch():
             try:
                 # 获取球队2的缩写（用于匹配）
-                all_teams = teams.get_teams()
-                team2_abbr = None
-                for t in all_teams:
-                    if t['id'] == team2_id:
-                        team2_abbr = t['abbreviation']
-                        break
+                team2_abbr = _team_abbr_map().get(team2_id)
 
                 if not team2_abbr:
                     return self._empty_record()
@@ -73,27 +76,29 @@ class MatchupHistoryCollector(BaseCollector):
                 )
                 df = games_api.league_game_finder_results.get_data_frame()
 
-                if df.empty:
+                if len(df) == 0:
                     return self._empty_record()
 
-                # 筛选对阵球队2的比赛
+                # 筛选对阵球队2的比赛：按分隔符切出对手缩写精确比较（子串匹配可能误中），
+                # 布尔掩码转为 ndarray 后直接索引所需列，不再构造中间 DataFrame
                 # MATCHUP 格式: "LAL vs. BOS" 或 "LAL @ BOS"
-                matchup_games = df[df['MATCHUP'].str.contains(team2_abbr, na=False)]
-
-                if matchup_games.empty:
+                opponents = df['MATCHUP'].str.split(_MATCHUP_RE, n=1).str[1]
+                mask = (opponents == team2_abbr).to_numpy()
+                if not mask.any():
                     return self._empty_record()
 
                 # 计算战绩
-                wins = len(matchup_games[matchup_games['WL'] == 'W'])
-                losses = len(matchup_games[matchup_games['WL'] == 'L'])
-                total = wins + losses
+                wl = df['WL'].to_numpy()[mask]
+                wins = int((wl == 'W').sum())
+                losses = int((wl == 'L').sum())
 
-                # 平均分差
-                avg_margin_raw = matchup_games["PLUS_MINUS"].mean()
-                avg_margin = cast(float, avg_margin_raw) if avg_margin_raw is not None else 0.0
+                # 平均分差（与 pandas mean 一致，忽略 NaN）
+                plus_minus = df['PLUS_MINUS'].to_numpy(dtype=float)[mask]
+                plus_minus = plus_minus[plus_minus == plus_minus]
+                avg_margin = float(plus_minus.mean()) if plus_minus.size else 0.0
 
-                # 上次交手日期
-                last_meeting = str(matchup_games.iloc[0]['GAME_DATE']) if not matchup_games.empty else None
+                # 上次交手日期（结果按日期倒序，取第一条）
+                last_meeting = str(df['GAME_DATE'].to_numpy()[mask][0])
 
                 return HeadToHeadRecord(
                     season_record=f"{wins}-{losses}",
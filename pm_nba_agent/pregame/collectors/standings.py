@@ -1,6 +1,6 @@
 """球队排名数据收集器。"""
 
-from typing import Optional, cast
+from typing import Optional
 
 from nba_api.stats.endpoints import leaguestandingsv3
 from nba_api.stats.library.parameters import SeasonType
@@ -35,33 +35,43 @@ class StandingsCollector(BaseCollector):
             )
             df = standings_api.standings.get_data_frame()
 
+            # 每个字段只解析一次列名，再按列批量转换
+            columns = zip(
+                self._column(df, ["TeamID", "TEAM_ID", "TEAMID"], self._to_int, 0),
+                self._column(df, ["WINS", "W"], self._to_int, 0),
+                self._column(df, ["LOSSES", "L"], self._to_int, 0),
+                self._column(df, ["WinPCT", "W_PCT"], self._to_float, 0.0),
+                self._column(df, ["ConferenceRank", "CONF_RANK", "Conference"], self._to_int, 0),
+                self._column(df, ["DivisionRank", "DIV_RANK", "Division"], self._to_int, 0),
+                self._column(df, ["L10", "LAST_10"], self._to_str, "0-0"),
+                self._column(df, ["strCurrentStreak", "STREAK"], self._to_str, ""),
+            )
+
             result = {}
-            for _, row in df.iterrows():
-                team_id = cast(int, self._get_int(row, ["TeamID", "TEAM_ID", "TEAMID"], 0))
+            for team_id, wins, losses, win_pct, conf_rank, div_rank, last_10, streak in columns:
                 result[team_id] = TeamStandings(
-                    wins=cast(int, self._get_int(row, ["WINS", "W"], 0)),
-                    losses=cast(int, self._get_int(row, ["LOSSES", "L"], 0)),
-                    win_pct=cast(float, self._get_float(row, ["WinPCT", "W_PCT"], 0.0)),
-                    conference_rank=cast(int, self._get_int(row, ["ConferenceRank", "CONF_RANK", "Conference"], 0)),
-                    division_rank=cast(int, self._get_int(row, ["DivisionRank", "DIV_RANK", "Division"], 0)),
-                    last_10=cast(str, self._get_str(row, ["L10", "LAST_10"], "0-0")),
-                    streak=cast(str, self._get_str(row, ["strCurrentStreak", "STREAK"], ""))
+                    wins=wins,
+                    losses=losses,
+                    win_pct=win_pct,
+                    conference_rank=conf_rank,
+                    division_rank=div_rank,
+                    last_10=last_10,
+                    streak=streak
                 )
 
             return result
 
         return self._fetch_with_cache(key, fetch, verbose)
 
-    def _get_value(self, row, keys: list[str], default):
+    def _column(self, df, keys: list[str], convert, default) -> list:
+        """取第一个存在的候选列并逐值转换；候选列都不存在时返回默认值列表。"""
         for key in keys:
-            if key in row:
-                value = row.get(key)
-                if value is not None:
-                    return value
-        return default
-
-    def _get_int(self, row, keys: list[str], default: int) -> int:
-        value = self._get_value(row, keys, default)
+            if key in df.columns:
+                return [convert(value, default) for value in df[key].tolist()]
+        return [default] * len(df)
+
+    @staticmethod
+    def _to_int(value, default: int) -> int:
         if value is None:
             return default
         try:
@@ -69,8 +79,8 @@ class StandingsCollector(BaseCollector):
         except (TypeError, ValueError):
             return default
 
-    def _get_float(self, row, keys: list[str], default: float) -> float:
-        value = self._get_value(row, keys, default)
+    @staticmethod
+    def _to_float(value, default: float) -> float:
         if value is None:
             return default
         try:
@@ -78,6 +88,6 @@ class StandingsCollector(BaseCollector):
         except (TypeError, ValueError):
             return default
 
-    def _get_str(self, row, keys: list[str], default: str) -> str:
-        value = self._get_value(row, keys, default)
+    @staticmethod
+    def _to_str(value, default: str) -> str:
         return str(value) if value is not None else default
@@ -1,17 +1,32 @@
 """球队统计数据收集器。"""
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
 from loguru import logger
 from nba_api.stats.endpoints import leaguedashteamstats, teamdashboardbygeneralsplits
 
+from ..cache import CacheManager
 from ..models.team_data import HomeAwaySplits, TeamStatistics
+from ..rate_limiter import RateLimiter
 from .base import BaseCollector
 
+# team_id -> (基础统计行, 高级统计行)
+_LeagueIndex = dict[int, tuple[dict[str, Any], dict[str, Any]]]
+
 
 class TeamStatsCollector(BaseCollector):
     """收集球队统计数据。"""
 
+    def __init__(
+        self,
+        cache_manager: Optional[CacheManager] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        super().__init__(cache_manager, rate_limiter)
+        # season -> (基础统计 DataFrame, 高级统计 DataFrame, 按球队索引)
+        self._league_index: dict[str, tuple[Any, Any, _LeagueIndex]] = {}
+
     def collect(
         self,
         team_id: int,
@@ -37,49 +52,48 @@ class TeamStatsCollector(BaseCollector):
         Returns:
             球队统计数据，失败返回 None
         """
-        # 先尝试从全局数据中获取（优化）
-        key_basic = f"league_stats_basic_{season}"
-        key_advanced = f"league_stats_advanced_{season}"
-
-        # 获取基础统计
-        def fetch_basic():
-            stats_api = leaguedashteamstats.LeagueDashTeamStats(
-                season=season,
-                season_type_all_star='Regular Season',
-                measure_type_detailed_defense='Base',
-                per_mode_detailed='PerGame'
+        # 先查缓存；只有两份联盟统计都未命中（冷缓存）时才开线程并发拉取
+        # （RateLimiter 线程安全，仍按全局节流），热缓存路径不创建线程池
+        frames: dict[str, Any] = {}
+        missing: list[str] = []
+        for measure_type in ('Base', 'Advanced'):
+            hit, data = (
+                self.cache.lookup(self._league_stats_key(season, measure_type))
+                if self.cache else (False, None)
             )
-            return stats_api.league_dash_team_stats.get_data_frame()
-
-        df_basic = self._fetch_with_cache(key_basic, fetch_basic, verbose)
-        if df_basic is None:
-            return None
-
-        # 获取高级统计
-        def fetch_advanced():
-            stats_api = leaguedashteamstats.LeagueDashTeamStats(
-                season=season,
-                season_type_all_star='Regular Season',
-                measure_type_detailed_defense='Advanced',
-                per_mode_detailed='PerGame'
-            )
-            return stats_api.league_dash_team_stats.get_data_frame()
-
-        df_advanced = self._fetch_with_cache(key_advanced, fetch_advanced, verbose)
-        if df_advanced is None:
+            if hit:
+                frames[measure_type] = data
+            else:
+                missing.append(measure_type)
+
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+                futures = {
+                    measure_type: pool.submit(
+                        self._fetch_league_stats, season, measure_type, verbose
+                    )
+                    for measure_type in missing
+                }
+                for measure_type, future in futures.items():
+                    frames[measure_type] = future.result()
+        else:
+            for measure_type in missing:
+                frames[measure_type] = self._fetch_league_stats(season, measure_type, verbose)
+
+        df_basic = frames['Base']
+        df_advanced = frames['Advanced']
+
+        if df_basic is None or df_advanced is None:
             return None
 
-        # 过滤指定球队
-        team_basic = df_basic[df_basic['TEAM_ID'] == team_id]
-        team_advanced = df_advanced[df_advanced['TEAM_ID'] == team_id]
-
-        if team_basic.empty or team_advanced.empty:
+        # 按球队索引查找（同一赛季的联盟数据只建一次索引）
+        rows = self._get_league_index(season, df_basic, df_advanced).get(team_id)
+        if rows is None:
             if verbose:
                 logger.warning("未找到球队 {} 的统计数据", team_id)
             return None
 
-        basic_row = team_basic.iloc[0]
-        advanced_row = team_advanced.iloc[0]
+        basic_row, advanced_row = rows
 
         return TeamStatistics(
             # 基础统计
@@ -102,6 +116,45 @@ class TeamStatsCollector(BaseCollector):
             efg_pct=float(advanced_row.get('EFG_PCT', 0))
         )
 
+    def _fetch_league_stats(self, season: str, measure_type: str, verbose: bool):
+        """获取全联盟球队统计（基础 'Base' 或高级 'Advanced'），带缓存。"""
+        key = self._league_stats_key(season, measure_type)
+
+        def fetch():
+            stats_api = leaguedashteamstats.LeagueDashTeamStats(
+                season=season,
+                season_type_all_star='Regular Season',
+                measure_type_detailed_defense=measure_type,
+                per_mode_detailed='PerGame'
+            )
+            return stats_api.league_dash_team_stats.get_data_frame()
+
+        return self._fetch_with_cache(key, fetch, verbose)
+
+    @staticmethod
+    def _league_stats_key(season: str, measure_type: str) -> str:
+        return f"league_stats_{'basic' if measure_type == 'Base' else 'advanced'}_{season}"
+
+    def _get_league_index(self, season: str, df_basic, df_advanced) -> _LeagueIndex:
+        """构建/复用赛季联盟统计的球队索引；缓存的 DataFrame 变化时重建。"""
+        cached = self._league_index.get(season)
+        if cached is not None and cached[0] is df_basic and cached[1] is df_advanced:
+            return cached[2]
+
+        advanced_by_team: dict[int, dict[str, Any]] = {}
+        for row in df_advanced.to_dict('records'):
+            advanced_by_team.setdefault(int(row['TEAM_ID']), row)
+
+        index: _LeagueIndex = {}
+        for row in df_basic.to_dict('records'):
+            team_id = int(row['TEAM_ID'])
+            advanced_row = advanced_by_team.get(team_id)
+            if advanced_row is not None and team_id not in index:
+                index[team_id] = (row, advanced_row)
+
+        self._league_index[season] = (df_basic, df_advanced, index)
+        return index
+
     def collect_splits(
         self,
         team_id: int,
@@ -128,16 +181,18 @@ class TeamStatsCollector(BaseCollector):
             )
             df = splits_api.overall_team_dashboard.get_data_frame()
 
-            # 查找主场和客场数据
-            home_row = df[df['GROUP_VALUE'] == 'Home']
-            away_row = df[df['GROUP_VALUE'] == 'Road']
+            # 查找主场和客场数据：一次转换为普通 dict，按 GROUP_VALUE 取首行，
+            # 后续字段读取不再经过 pandas Series 的索引查找
+            rows_by_group: dict[Any, dict[str, Any]] = {}
+            if 'GROUP_VALUE' in df.columns:
+                for row in df.to_dict('records'):
+                    rows_by_group.setdefault(row['GROUP_VALUE'], row)
 
-            if home_row.empty or away_row.empty:
+            home = rows_by_group.get('Home')
+            away = rows_by_group.get('Road')
+            if home is None or away is None:
                 return None
 
-            home = home_row.iloc[0]
-            away = away_row.iloc[0]
-
             # 解析战绩字符串 "25-15"
             def parse_record(record_str):
                 try:
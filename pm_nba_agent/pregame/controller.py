@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from loguru import logger
@@ -61,8 +62,17 @@ class PregameController:
             logger.info("解析成功: {} vs {}", team1.full_name, team2.full_name)
             logger.info("收集数据...")
 
-        team1_data = self._collect_team_data(team1, season, verbose)
-        team2_data = self._collect_team_data(team2, season, verbose)
+        # 两队数据与对阵历史互不依赖，并发收集（共享限流器保证整体请求间隔，
+        # 同一缓存键的并发请求由收集器合并为一次）
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            future_team1 = pool.submit(self._collect_team_data, team1, season, verbose)
+            future_team2 = pool.submit(self._collect_team_data, team2, season, verbose)
+            future_h2h = pool.submit(
+                self.matchup_collector.collect, team1.id, team2.id, season, verbose
+            )
+            team1_data = future_team1.result()
+            team2_data = future_team2.result()
+            h2h = future_h2h.result()
 
         if not team1_data or not team2_data:
             if verbose:
@@ -72,11 +82,6 @@ class PregameController:
         home_data = team2_data
         away_data = team1_data
 
-        if verbose:
-            logger.info("分析对阵历史...")
-
-        h2h = self.matchup_collector.collect(team1.id, team2.id, season, verbose)
-
         if verbose:
             logger.info("执行分析...")
 
@@ -1,10 +1,19 @@
 """赛前分析数据模型。"""
 
-from dataclasses import dataclass
-from typing import Optional
+from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
 
-@dataclass
+if TYPE_CHECKING:
+    from ..collectors.matchup import HeadToHeadRecord
+
+
+# 影响力等级对应的排序权重
+_IMPACT_SCORES = {"High": 3, "Medium": 2, "Low": 1}
+
+
+@dataclass(slots=True)
 class StyleMatchup:
     """球队风格对比分析。"""
 
@@ -27,22 +36,22 @@ class StyleMatchup:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchupAnalysis:
     """对阵分析结果。"""
 
-    head_to_head: dict  # 对阵历史（HeadToHeadRecord.to_dict()）
+    head_to_head: Optional[HeadToHeadRecord]  # 对阵历史
     style_matchup: StyleMatchup  # 风格对比
 
     def to_dict(self) -> dict:
         """转换为字典。"""
         return {
-            'head_to_head': self.head_to_head,
+            'head_to_head': self.head_to_head.to_dict() if self.head_to_head else {},
             'style_matchup': self.style_matchup.to_dict()
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparisonItem:
     """单项对比。"""
 
@@ -63,7 +72,7 @@ class ComparisonItem:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrengthComparison:
     """实力对比分析。"""
 
@@ -85,7 +94,7 @@ class StrengthComparison:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Factor:
     """关键因素。"""
 
@@ -93,6 +102,10 @@ class Factor:
     impact: str  # 影响力等级："High" / "Medium" / "Low"
     description: str  # 描述
     favors: Optional[str]  # 有利于哪方："Home" / "Away" / None
+    impact_score: int = field(init=False, repr=False, compare=False)  # 排序权重，由 impact 推导
+
+    def __post_init__(self) -> None:
+        self.impact_score = _IMPACT_SCORES.get(self.impact, 0)
 
     def to_dict(self) -> dict:
         """转换为字典。"""
@@ -104,7 +117,7 @@ class Factor:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyFactors:
     """关键因素列表。"""
 
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class GameBasicInfo:
     """比赛基本信息。"""
 
@@ -23,7 +23,7 @@ class GameBasicInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PregameReport:
     """完整的赛前分析报告。"""
 
@@ -1,11 +1,36 @@
 """球队赛前数据模型。"""
 
-from dataclasses import dataclass, field
-from typing import Optional
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
+# 以下模型由收集器写入缓存并在多次分析之间复用，构建后不再修改：
+# 使用 frozen + slots，并在首次 to_dict 时缓存结果（返回的字典为共享只读对象）
 
-@dataclass
-class TeamStandings:
+
+class _CachedDictMixin(ABC):
+    """为 frozen + slots 模型缓存 to_dict 结果，子类实现 _build_dict。
+
+    缓存放在基类的独立槽位中，不属于 dataclass 字段，不参与比较、repr 与 pickle。
+    """
+
+    __slots__ = ('_dict',)
+
+    def to_dict(self) -> dict:
+        """转换为字典（首次调用后缓存，调用方不应修改返回值）。"""
+        try:
+            return self._dict
+        except AttributeError:
+            result = self._build_dict()
+            object.__setattr__(self, '_dict', result)
+            return result
+
+    @abstractmethod
+    def _build_dict(self) -> dict:
+        """构建 to_dict 的结果（子类实现）。"""
+
+
+@dataclass(frozen=True, slots=True)
+class TeamStandings(_CachedDictMixin):
     """球队排名和战绩数据。"""
 
     wins: int
@@ -16,8 +41,7 @@ class TeamStandings:
     last_10: str  # 最近10场战绩，如 "7-3"
     streak: str  # 连胜/连败，如 "W2" 或 "L3"
 
-    def to_dict(self) -> dict:
-        """转换为字典。"""
+    def _build_dict(self) -> dict:
         return {
             'wins': self.wins,
             'losses': self.losses,
@@ -29,8 +53,8 @@ class TeamStandings:
         }
 
 
-@dataclass
-class GameSummary:
+@dataclass(frozen=True, slots=True)
+class GameSummary(_CachedDictMixin):
     """单场比赛摘要。"""
 
     game_id: str
@@ -42,8 +66,7 @@ class GameSummary:
     opp_points: int
     plus_minus: int
 
-    def to_dict(self) -> dict:
-        """转换为字典。"""
+    def _build_dict(self) -> dict:
         return {
             'game_id': self.game_id,
             'date': self.date,
@@ -56,8 +79,8 @@ class GameSummary:
         }
 
 
-@dataclass
-class RecentForm:
+@dataclass(frozen=True, slots=True)
+class RecentForm(_CachedDictMixin):
     """最近比赛表现统计。"""
 
     last_n_games: int  # 最近N场
@@ -69,8 +92,7 @@ class RecentForm:
     avg_margin: float
     momentum: float  # 势头评分 (0-100)
 
-    def to_dict(self) -> dict:
-        """转换为字典。"""
+    def _build_dict(self) -> dict:
         return {
             'last_n_games': self.last_n_games,
             'wins': self.wins,
@@ -83,8 +105,8 @@ class RecentForm:
         }
 
 
-@dataclass
-class HomeAwaySplits:
+@dataclass(frozen=True, slots=True)
+class HomeAwaySplits(_CachedDictMixin):
     """主客场数据对比。"""
 
     home_wins: int
@@ -99,8 +121,7 @@ class HomeAwaySplits:
     away_ppg: float
     away_opp_ppg: float
 
-    def to_dict(self) -> dict:
-        """转换为字典。"""
+    def _build_dict(self) -> dict:
         return {
             'home': {
                 'wins': self.home_wins,
@@ -119,8 +140,8 @@ class HomeAwaySplits:
         }
 
 
-@dataclass
-class TeamStatistics:
+@dataclass(frozen=True, slots=True)
+class TeamStatistics(_CachedDictMixin):
     """球队统计数据。"""
 
     # 基础统计
@@ -143,8 +164,7 @@ class TeamStatistics:
     ts_pct: float  # 真实命中率
     efg_pct: float  # 有效命中率
 
-    def to_dict(self) -> dict:
-        """转换为字典。"""
+    def _build_dict(self) -> dict:
         return {
             'basic': {
                 'ppg': self.ppg,
@@ -169,7 +189,7 @@ class TeamStatistics:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TeamPregameData:
     """完整的球队赛前数据。"""
 
@@ -1,5 +1,7 @@
 """API 限流器，控制请求频率避免被限流。"""
 
+import asyncio
+import threading
 import time
 from typing import Optional
 
@@ -10,6 +12,10 @@ class RateLimiter:
     使用方法:
         limiter = RateLimiter(delay=0.6)
         limiter.wait()  # 等待到可以发送下一个请求
+        await limiter.async_wait()  # 异步上下文中使用，不阻塞事件循环
+
+    线程安全：多个收集器共享同一实例时，每次调用按顺序预约各自的时间槽。
+    同步与异步调用共用同一时间线，混用时间隔仍然成立。
     """
 
     def __init__(self, delay: float = 0.6):
@@ -19,17 +25,31 @@ class RateLimiter:
             delay: 两次请求之间的最小间隔（秒），默认0.6秒
         """
         self.delay = delay
+        # 单调时钟时间戳，不受系统时间调整影响
         self.last_call: Optional[float] = None
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
         """等待到可以发送下一个请求。
 
         如果距离上次调用不足 delay 秒，则等待剩余时间。
         """
-        if self.last_call is not None:
-            elapsed = time.time() - self.last_call
-            if elapsed < self.delay:
-                wait_time = self.delay - elapsed
-                time.sleep(wait_time)
-
-        self.last_call = time.time()
+        wait_time = self._reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def async_wait(self) -> None:
+        """异步等待到可以发送下一个请求，等待期间让出事件循环。"""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def _reserve(self) -> float:
+        """预约下一个时间槽，返回需要等待的秒数（锁内只做计算，不睡眠）。"""
+        with self._lock:
+            now = time.monotonic()
+            slot = now
+            if self.last_call is not None:
+                slot = max(now, self.last_call + self.delay)
+            self.last_call = slot
+        return slot - now
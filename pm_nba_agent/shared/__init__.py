@@ -1,14 +1,18 @@
 """共享模块"""
 
-from .channels import Channels
-from .task_models import TaskState, TaskStatus, TaskConfig
+from .channels import ChannelBundle, Channels
+from .encoding import JSON_ENCODER
+from .task_models import TaskState, TaskStatus, TaskConfig, utc_now_iso
 from .redis_client import RedisClient, get_redis
 
 __all__ = [
+    "ChannelBundle",
     "Channels",
+    "JSON_ENCODER",
     "TaskState",
     "TaskStatus",
     "TaskConfig",
     "RedisClient",
     "get_redis",
+    "utc_now_iso",
 ]
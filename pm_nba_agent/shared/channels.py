@@ -1,5 +1,17 @@
 """Redis Channel 命名规范"""
 
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelBundle:
+    """单个任务的 Channel/Key 集合，任务创建时构建一次后复用"""
+
+    events: str
+    status: str
+    config: str
+    snapshots: str
+
 
 class Channels:
     """Redis Channel 命名工具类"""
@@ -25,12 +37,39 @@ class Channels:
         """任务配置 Key"""
         return f"{cls.PREFIX}:task:{task_id}:config"
 
+    # task_snapshots Hash 的字段（可回放的状态快照事件名），按回放顺序排列；
+    # Worker 写入、API 回放与删除任务都以此为准
+    SNAPSHOT_EVENTS = (
+        "polymarket_info",
+        "scoreboard",
+        "polymarket_book",
+        "auto_buy_state",
+        "auto_trade_state",
+        "auto_sell_state",
+        "position_state",
+    )
+
+    @classmethod
+    def task_snapshots(cls, task_id: str) -> str:
+        """任务快照 Hash Key（字段为事件名，值为最近一条 SSE 消息）"""
+        return f"{cls.PREFIX}:task:{task_id}:snapshots"
+
     @classmethod
     def task_snapshot(cls, task_id: str, name: str) -> str:
-        """任务快照 Key"""
+        """单条任务快照 Key（已弃用，快照改存 task_snapshots Hash；仅用于清理旧数据）"""
         safe_name = name.replace(":", "_")
         return f"{cls.PREFIX}:task:{task_id}:snapshot:{safe_name}"
 
+    @classmethod
+    def bundle(cls, task_id: str) -> ChannelBundle:
+        """构建任务的 Channel/Key 集合"""
+        return ChannelBundle(
+            events=cls.task_events(task_id),
+            status=cls.task_status(task_id),
+            config=cls.task_config(task_id),
+            snapshots=cls.task_snapshots(task_id),
+        )
+
     @classmethod
     def all_tasks(cls) -> str:
         """所有任务集合 Key"""
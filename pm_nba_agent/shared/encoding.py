@@ -0,0 +1,7 @@
+"""JSON 编码工具"""
+
+import json
+
+# json.dumps 传入非默认参数时每次都会新建 JSONEncoder；SSE 事件推送频繁，
+# Worker 与 API 共用同一个保留中文原字符的编码器实例
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
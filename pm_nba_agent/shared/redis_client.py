@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any, AsyncGenerator, Optional
+import socket
+from typing import Any, AsyncGenerator, Callable, Iterable, Optional, Sequence
 
 import redis.asyncio as redis
 from loguru import logger
 
 
+def _keepalive_options() -> dict[int, int]:
+    """TCP keepalive 参数（仅在平台支持时设置），及早发现被中间设备断开的空闲连接"""
+    options: dict[int, int] = {}
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        opt = getattr(socket, name, None)
+        if opt is not None:
+            options[opt] = value
+    return options
+
+
 class RedisClient:
     """异步 Redis 客户端封装"""
 
-    def __init__(self, url: Optional[str] = None):
+    # 订阅消息超过该长度时在线程中解码，避免大段 JSON 解析阻塞事件循环；
+    # 小消息切换线程的开销高于解码本身，仍在事件循环内直接解码
+    DECODE_OFFLOAD_THRESHOLD = 8192
+
+    def __init__(self, url: Optional[str] = None, max_connections: Optional[int] = None):
         self._url = url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._max_connections = max_connections or int(
+            os.getenv("REDIS_MAX_CONNECTIONS") or 64
+        )
         self._pool: Optional[redis.ConnectionPool] = None
         self._client: Optional[redis.Redis] = None
 
@@ -25,7 +44,10 @@ class RedisClient:
         self._pool = redis.ConnectionPool.from_url(
             self._url,
             decode_responses=True,
-            max_connections=50,
+            max_connections=self._max_connections,
+            socket_keepalive=True,
+            socket_keepalive_options=_keepalive_options(),
+            health_check_interval=30,
         )
         self._client = redis.Redis(connection_pool=self._pool)
         # 测试连接
@@ -72,6 +94,52 @@ class RedisClient:
         """检查键是否存在"""
         return await self.client.exists(key) > 0
 
+    # ========== 批量操作 ==========
+
+    async def mget(self, keys: Sequence[str]) -> list[Optional[str]]:
+        """批量获取值（一次往返），结果与 keys 顺序一致"""
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
+    async def pipeline_exec(
+        self,
+        ops: Iterable[tuple[Any, ...]],
+    ) -> list[Any]:
+        """以非事务 pipeline 批量执行命令（一次往返）
+
+        Args:
+            ops: (命令名, 位置参数) 或 (命令名, 位置参数, 关键字参数) 序列，
+                如 ("set", (key, value), {"ex": 60})
+
+        Returns:
+            各命令结果，顺序与 ops 一致
+        """
+        async with self.client.pipeline(transaction=False) as pipe:
+            for op in ops:
+                name, args = op[0], op[1]
+                kwargs = op[2] if len(op) > 2 else {}
+                getattr(pipe, name)(*args, **kwargs)
+            return await pipe.execute()
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        """设置过期时间"""
+        return await self.client.expire(key, seconds)
+
+    # ========== Hash 操作 ==========
+
+    async def hset(self, key: str, field: str, value: str) -> int:
+        """设置 Hash 字段"""
+        return await self.client.hset(key, field, value)
+
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        """获取 Hash 字段"""
+        return await self.client.hget(key, field)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        """获取 Hash 所有字段"""
+        return await self.client.hgetall(key)
+
     # ========== Set 操作 ==========
 
     async def sadd(self, key: str, *values: str) -> int:
@@ -92,17 +160,69 @@ class RedisClient:
         """发布消息"""
         return await self.client.publish(channel, message)
 
+    @staticmethod
+    async def get_message_batch(
+        pubsub: Any,
+        max_messages: int = 256,
+    ) -> list[dict[str, Any]]:
+        """等待下一条消息，并顺带取出已到达的后续消息（不再等待）
+
+        突发推送时一次唤醒处理一批消息，调用方可据此合并可覆盖的事件。
+        订阅确认等控制消息已被忽略，可能返回空列表。
+        """
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+        batch: list[dict[str, Any]] = []
+        while message is not None:
+            batch.append(message)
+            if len(batch) >= max_messages:
+                break
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)
+        return batch
+
+    @classmethod
+    async def decode_message(
+        cls,
+        message: dict[str, Any],
+        decode: Callable[[Any], Any],
+    ) -> bool:
+        """用 decode 就地替换 message["data"]，大消息放到线程中解码
+
+        Returns:
+            解码是否成功；失败时记录日志，消息保持原样
+        """
+        data = message["data"]
+        try:
+            if len(data) > cls.DECODE_OFFLOAD_THRESHOLD:
+                message["data"] = await asyncio.to_thread(decode, data)
+            else:
+                message["data"] = decode(data)
+        except Exception as e:
+            logger.warning("订阅消息解码失败 ({}): {}", message.get("channel"), e)
+            return False
+        return True
+
     async def subscribe(
         self,
         *channels: str,
+        decode: Optional[Callable[[Any], Any]] = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
-        """订阅 Channel（异步生成器）"""
+        """订阅 Channel（异步生成器）
+
+        Args:
+            channels: 订阅的 Channel
+            decode: 可选的消息解码函数（如 json.loads），解码后的结果写回
+                message["data"]；解码失败的消息会被跳过
+        """
         pubsub = self.client.pubsub()
         await pubsub.subscribe(*channels)
 
         try:
-            async for message in pubsub.listen():
-                if message["type"] == "message":
+            while True:
+                for message in await self.get_message_batch(pubsub):
+                    if message["type"] != "message":
+                        continue
+                    if decode is not None and not await self.decode_message(message, decode):
+                        continue
                     yield message
         finally:
             await pubsub.unsubscribe(*channels)
@@ -111,14 +231,19 @@ class RedisClient:
     async def psubscribe(
         self,
         *patterns: str,
+        decode: Optional[Callable[[Any], Any]] = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
-        """模式订阅 Channel（异步生成器）"""
+        """模式订阅 Channel（异步生成器），decode 含义同 subscribe"""
         pubsub = self.client.pubsub()
         await pubsub.psubscribe(*patterns)
 
         try:
-            async for message in pubsub.listen():
-                if message["type"] == "pmessage":
+            while True:
+                for message in await self.get_message_batch(pubsub):
+                    if message["type"] != "pmessage":
+                        continue
+                    if decode is not None and not await self.decode_message(message, decode):
+                        continue
                     yield message
         finally:
             await pubsub.punsubscribe(*patterns)
@@ -1,12 +1,17 @@
 """任务模型定义"""
 
 import json
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any, Optional
 
 
+def utc_now_iso() -> str:
+    """当前 UTC 时间，ISO 格式并以 Z 结尾（固定微秒位，字符串可直接按时间排序）"""
+    return datetime.now(UTC).replace(tzinfo=None).isoformat(timespec="microseconds") + "Z"
+
+
 class TaskState(str, Enum):
     """任务状态枚举"""
 
@@ -18,7 +23,7 @@ class TaskState(str, Enum):
     FAILED = "failed"  # 异常失败
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskConfig:
     """任务配置（从 LiveStreamRequest 提取）"""
 
@@ -79,8 +84,35 @@ class TaskConfig:
     enable_analysis: bool = True
 
     def to_dict(self) -> dict[str, Any]:
-        """转换为字典"""
-        return asdict(self)
+        """转换为字典
+
+        显式列出字段，不经 dataclasses.asdict 逐层深拷贝；嵌套的 dict/list 与
+        实例共享引用，调用方只能读取或复制后修改，不要原地修改。
+        """
+        return {
+            "url": self.url,
+            "poll_interval": self.poll_interval,
+            "user_id": self.user_id,
+            "include_scoreboard": self.include_scoreboard,
+            "include_boxscore": self.include_boxscore,
+            "analysis_interval": self.analysis_interval,
+            "strategy_ids": self.strategy_ids,
+            "strategy_params_map": self.strategy_params_map,
+            "strategy_id": self.strategy_id,
+            "strategy_params": self.strategy_params,
+            "enable_trading": self.enable_trading,
+            "execution_mode": self.execution_mode,
+            "order_type": self.order_type,
+            "order_expiration": self.order_expiration,
+            "min_order_amount": self.min_order_amount,
+            "trade_cooldown_seconds": self.trade_cooldown_seconds,
+            "private_key": self.private_key,
+            "proxy_address": self.proxy_address,
+            "auto_buy": self.auto_buy,
+            "auto_sell": self.auto_sell,
+            "auto_trade": self.auto_trade,
+            "enable_analysis": self.enable_analysis,
+        }
 
     def to_json(self) -> str:
         """序列化为 JSON"""
@@ -124,7 +156,7 @@ class TaskConfig:
         return cls.from_dict(json.loads(json_str))
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskStatus:
     """任务状态"""
 
@@ -179,7 +211,7 @@ class TaskStatus:
     @classmethod
     def create(cls, task_id: str, user_id: str = "") -> "TaskStatus":
         """创建新任务状态"""
-        now = datetime.utcnow().isoformat() + "Z"
+        now = utc_now_iso()
         return cls(
             task_id=task_id,
             state=TaskState.PENDING,
@@ -191,7 +223,7 @@ class TaskStatus:
     def update_state(self, state: TaskState, error: Optional[str] = None) -> None:
         """更新状态"""
         self.state = state
-        self.updated_at = datetime.utcnow().isoformat() + "Z"
+        self.updated_at = utc_now_iso()
         if error:
             self.error = error
 
@@ -202,7 +234,7 @@ class TaskStatus:
         self.game_id = game_id
         self.home_team = home_team
         self.away_team = away_team
-        self.updated_at = datetime.utcnow().isoformat() + "Z"
+        self.updated_at = utc_now_iso()
 
 
 def _normalize_auto_buy(value: Any) -> dict[str, Any]:
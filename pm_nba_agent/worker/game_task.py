@@ -17,7 +17,15 @@ from pm_nba_agent.agent import GameAnalyzer
 from pm_nba_agent.polymarket.models import PositionContext
 from pm_nba_agent.polymarket.orders import create_polymarket_order
 from pm_nba_agent.polymarket.positions import get_current_positions
-from pm_nba_agent.shared import Channels, RedisClient, TaskConfig, TaskState, TaskStatus
+from pm_nba_agent.shared import (
+    Channels,
+    JSON_ENCODER,
+    RedisClient,
+    TaskConfig,
+    TaskState,
+    TaskStatus,
+    utc_now_iso,
+)
 
 
 @dataclass
@@ -325,15 +333,7 @@ class RuleEngine:
 class GameTask:
     """单场比赛后台任务"""
 
-    SNAPSHOT_EVENTS = {
-        "polymarket_info",
-        "polymarket_book",
-        "scoreboard",
-        "auto_buy_state",
-        "auto_trade_state",
-        "auto_sell_state",
-        "position_state",
-    }
+    SNAPSHOT_EVENTS = frozenset(Channels.SNAPSHOT_EVENTS)
     BOTH_SIDE = "__BOTH__"
 
     def __init__(
@@ -345,6 +345,7 @@ class GameTask:
         analyzer: Optional[GameAnalyzer] = None,
     ):
         self.task_id = task_id
+        self.channels = Channels.bundle(task_id)
         self.config = config
         self.redis = redis
         self.fetcher = fetcher
@@ -865,7 +866,7 @@ class GameTask:
             "strategy_rules": cfg.get("strategy_rules", {}),
             "timestamp": self._now_iso(),
         }
-        await self._publish_event(f"event: auto_buy_state\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n")
+        await self._publish_event(f"event: auto_buy_state\ndata: {JSON_ENCODER.encode(payload)}\n\n")
 
     async def _get_auto_trade_config_snapshot(self) -> dict[str, Any]:
         async with self._config_lock:
@@ -884,7 +885,7 @@ class GameTask:
             "timestamp": self._now_iso(),
         }
         await self._publish_event(
-            f"event: auto_trade_state\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+            f"event: auto_trade_state\ndata: {JSON_ENCODER.encode(payload)}\n\n"
         )
 
     async def _auto_trade_tick_loop(self) -> None:
@@ -1016,7 +1017,7 @@ class GameTask:
             "timestamp": self._now_iso(),
         }
         await self._publish_event(
-            f"event: auto_trade_execution\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+            f"event: auto_trade_execution\ndata: {JSON_ENCODER.encode(payload)}\n\n"
         )
 
     async def _get_auto_sell_config_snapshot(self) -> dict[str, Any]:
@@ -1036,7 +1037,7 @@ class GameTask:
             "outcome_rules": cfg.get("outcome_rules", {}),
             "timestamp": self._now_iso(),
         }
-        await self._publish_event(f"event: auto_sell_state\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n")
+        await self._publish_event(f"event: auto_sell_state\ndata: {JSON_ENCODER.encode(payload)}\n\n")
 
     async def _publish_auto_sell_execution(
         self,
@@ -1051,7 +1052,7 @@ class GameTask:
             "source": "task_auto_sell",
             "timestamp": self._now_iso(),
         }
-        await self._publish_event(f"event: auto_sell_execution\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n")
+        await self._publish_event(f"event: auto_sell_execution\ndata: {JSON_ENCODER.encode(payload)}\n\n")
 
     async def _publish_position_state(self) -> None:
         payload = {
@@ -1061,7 +1062,7 @@ class GameTask:
             "condition_id": self._market_condition_id,
             "timestamp": self._now_iso(),
         }
-        await self._publish_event(f"event: position_state\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n")
+        await self._publish_event(f"event: position_state\ndata: {JSON_ENCODER.encode(payload)}\n\n")
 
     async def _position_refresh_loop(self) -> None:
         while not self._cancelled:
@@ -1431,21 +1432,26 @@ class GameTask:
         return False
 
     async def _publish_event(self, event: str) -> None:
-        """发布事件到 Redis"""
-        await self._cache_snapshot(event)
-        channel = Channels.task_events(self.task_id)
-        await self.redis.publish(channel, event)
+        """发布事件到 Redis
+
+        可回放事件同时写入快照 Hash，与 PUBLISH 合并为一次 pipeline 往返。
+        """
+        ops = self._snapshot_ops(event)
+        if not ops:
+            await self.redis.publish(self.channels.events, event)
+            return
+
+        ops.append(("publish", (self.channels.events, event)))
+        await self.redis.pipeline_exec(ops)
 
     async def _save_status(self, status: TaskStatus) -> None:
         """保存任务状态到 Redis"""
-        key = Channels.task_status(self.task_id)
         # 状态保留 24 小时
-        await self.redis.set(key, status.to_json(), ex=86400)
+        await self.redis.set(self.channels.status, status.to_json(), ex=86400)
 
     async def _load_or_create_status(self) -> TaskStatus:
         """加载已有状态，避免覆盖 created_at/user_id 等字段"""
-        key = Channels.task_status(self.task_id)
-        data = await self.redis.get(key)
+        data = await self.redis.get(self.channels.status)
         if not data:
             return TaskStatus.create(self.task_id)
         try:
@@ -1455,21 +1461,23 @@ class GameTask:
 
     async def _publish_status(self, status: TaskStatus) -> None:
         """发布任务状态事件"""
-        payload = json.dumps(status.to_dict(), ensure_ascii=False)
+        payload = JSON_ENCODER.encode(status.to_dict())
         await self._publish_event(f"event: task_status\ndata: {payload}\n\n")
 
-    async def _cache_snapshot(self, event: str) -> None:
-        """缓存可回放事件"""
+    def _snapshot_ops(self, event: str) -> list[tuple[Any, ...]]:
+        """可回放事件写入快照 Hash 的命令（保留 24 小时，每次写入刷新）；非快照事件返回空列表"""
         event_type = None
         for line in event.splitlines():
             if line.startswith("event:"):
                 event_type = line[6:].strip()
 
         if not event_type or event_type not in self.SNAPSHOT_EVENTS:
-            return
+            return []
 
-        snapshot_key = Channels.task_snapshot(self.task_id, event_type)
-        await self.redis.set(snapshot_key, event, ex=86400)
+        return [
+            ("hset", (self.channels.snapshots, event_type, event)),
+            ("expire", (self.channels.snapshots, 86400)),
+        ]
 
     @staticmethod
     def _parse_sse_event(event: str) -> tuple[Optional[str], Optional[dict[str, Any]]]:
@@ -1497,7 +1505,7 @@ class GameTask:
 
     @staticmethod
     def _format_sse_event(event_type: str, payload: dict[str, Any]) -> str:
-        return f"event: {event_type}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        return f"event: {event_type}\ndata: {JSON_ENCODER.encode(payload)}\n\n"
 
     @staticmethod
     def _deep_merge_dict(base: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
@@ -1512,4 +1520,4 @@ class GameTask:
 
     @staticmethod
     def _now_iso() -> str:
-        return datetime.utcnow().isoformat() + "Z"
+        return utc_now_iso()
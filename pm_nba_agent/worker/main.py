@@ -15,6 +15,7 @@ load_dotenv(dotenv_path=root_dir / ".env", override=False)
 from pm_nba_agent.api.services.data_fetcher import DataFetcher
 from pm_nba_agent.agent import GameAnalyzer, AnalysisConfig
 from pm_nba_agent.logging_config import configure_logging
+from pm_nba_agent.polymarket._http import close_http_clients
 from pm_nba_agent.shared import RedisClient
 from pm_nba_agent.worker.task_manager import TaskManager
 
@@ -71,16 +72,27 @@ async def main() -> None:
 
     # 清理资源
     await analyzer.close()
+    await close_http_clients()
     fetcher.shutdown()
     await redis.close()
 
     logger.info("Worker 已停止")
 
 
+def _loop_factory():
+    """优先使用 uvloop（随 uvicorn[standard] 安装），不可用时回退到默认事件循环"""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def run() -> None:
     """入口函数"""
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         pass
     sys.exit(0)
@@ -105,15 +105,16 @@ class TaskManager:
 
     async def list_tasks(self) -> list[TaskStatus]:
         """列出所有任务"""
-        task_ids = await self.redis.smembers(Channels.all_tasks())
-        statuses = []
+        task_ids = list(await self.redis.smembers(Channels.all_tasks()))
+        return [status for status in await self._load_statuses(task_ids) if status]
 
-        for task_id in task_ids:
-            status = await self.get_task_status(task_id)
-            if status:
-                statuses.append(status)
-
-        return statuses
+    async def _load_statuses(self, task_ids: list[str]) -> list[Optional[TaskStatus]]:
+        """批量加载任务状态（MGET 一次往返），顺序与 task_ids 一致"""
+        keys = [Channels.task_status(task_id) for task_id in task_ids]
+        return [
+            TaskStatus.from_json(data) if data else None
+            for data in await self.redis.mget(keys)
+        ]
 
     async def _run_task(self, task_id: str, task: GameTask) -> None:
         """运行任务并在完成后清理"""
@@ -125,20 +126,21 @@ class TaskManager:
 
     async def _recover_tasks(self) -> None:
         """恢复未完成的任务"""
-        task_ids = await self.redis.smembers(Channels.all_tasks())
+        task_ids = list(await self.redis.smembers(Channels.all_tasks()))
 
-        for task_id in task_ids:
-            status = await self.get_task_status(task_id)
-            if not status:
-                continue
+        # 恢复未完成状态（包括取消中）
+        pending: list[tuple[str, TaskStatus]] = [
+            (task_id, status)
+            for task_id, status in zip(task_ids, await self._load_statuses(task_ids))
+            if status
+            and status.state in (TaskState.PENDING, TaskState.RUNNING, TaskState.CANCELLING)
+        ]
 
-            # 恢复未完成状态（包括取消中）
-            if status.state not in (TaskState.PENDING, TaskState.RUNNING, TaskState.CANCELLING):
-                continue
+        # 批量获取配置
+        config_keys = [Channels.task_config(task_id) for task_id, _ in pending]
+        config_list = await self.redis.mget(config_keys)
 
-            # 获取配置
-            config_key = Channels.task_config(task_id)
-            config_data = await self.redis.get(config_key)
+        for (task_id, status), config_data in zip(pending, config_list):
             if not config_data:
                 logger.warning("任务配置不存在，跳过恢复: {}", task_id)
                 continue
@@ -165,7 +167,7 @@ class TaskManager:
         logger.info("开始监听控制 Channel: {}", Channels.CONTROL)
 
         try:
-            async for message in self.redis.subscribe(Channels.CONTROL):
+            async for message in self.redis.subscribe(Channels.CONTROL, decode=json.loads):
                 if not self._running:
                     break
 
@@ -176,9 +178,9 @@ class TaskManager:
             logger.error("控制 Channel 监听异常: {}", e)
 
     async def _handle_control_message(self, message: dict) -> None:
-        """处理控制消息"""
+        """处理控制消息（message["data"] 已由订阅解码为 dict）"""
         try:
-            data = json.loads(message["data"])
+            data = message["data"]
             action = data.get("action")
             task_id = data.get("task_id")
 